@@ -19,12 +19,61 @@ existing class with a new interface.
 - Real-world integration scenarios
 '''
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Union, Callable, Tuple, Protocol
 import json
+import re
+from collections import OrderedDict
+import time
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, unescape
 from datetime import datetime
 
+try:  # Optional: orjson is several times faster for small dicts
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_loads(data: str) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, indent=2)
+
+# Legacy colon-separated record: ID:1:NAME:John:EMAIL:john@example.com[:CREATED:2023-01-15]
+# match().groups() yields exactly (id, name, email, created) - no throwaway split list
+_LEGACY_RE = re.compile(r'^ID:(\d+):NAME:([^:]*):EMAIL:([^:]*)(?::CREATED:(.+))?$')
+
+# A flat <user> record: nothing but <tag>text</tag> leaves with non-empty text
+# whose only entities are the ones escape() produces. Anything else (nesting,
+# attributes, empty or self-closing elements, whitespace) goes to ElementTree.
+_XML_TEXT = r'(?:[^<&]|&(?:amp|lt|gt);)+'
+_XML_RECORD_RE = re.compile(r'<user>(?:<(\w+)>' + _XML_TEXT + r'</\1>)*</user>')
+_XML_RE = re.compile(r'<(\w+)>(' + _XML_TEXT + r')</\1>')
+
+# Skeleton for the standard user record, filled in with escaped values
+_XML_USER_FIELDS = ('id', 'name', 'email')
+_XML_USER_TEMPLATE = '<user><id>{}</id><name>{}</name><email>{}</email></user>'
+
+# [last refresh time, cached ISO string] - shared by every response builder
+_ts_cache = [0.0, ""]
+
+def _now_iso() -> str:
+    """Current timestamp in ISO format, refreshed at most once per second"""
+    t = time.time()
+    c = _ts_cache
+    if t - c[0] >= 1.0:
+        c[0] = t
+        c[1] = datetime.fromtimestamp(t).isoformat()
+    return c[1]
+
+def _today_iso() -> str:
+    """Current date as YYYY-MM-DD, sliced from the cached ISO timestamp"""
+    return _now_iso()[:10]
+
 # ============================================================================
 # LEGACY SYSTEM SIMULATION (Interview scenario: integrating with old systems)
 # ============================================================================
@@ -38,35 +87,32 @@ class LegacyDatabase:
                 {'id': 2, 'name': 'Jane Smith', 'email': 'jane@example.com', 'created': '2023-02-20'}
             ]
         }
+        # id -> row dict kept in sync with the users list for O(1) lookups
+        self._by_id: Dict[int, Dict[str, Any]] = {u['id']: u for u in self._data['users']}
     
     def fetch_user_data_legacy_format(self, user_id: int) -> str:
         """Returns data in old colon-separated format"""
-        for user in self._data['users']:
-            if user['id'] == user_id:
-                return f"ID:{user['id']}:NAME:{user['name']}:EMAIL:{user['email']}:CREATED:{user['created']}"
-        return "USER_NOT_FOUND"
+        user = self._by_id.get(user_id)
+        if user is None:
+            return "USER_NOT_FOUND"
+        return ':'.join(('ID', str(user['id']), 'NAME', user['name'], 'EMAIL', user['email'],
+                         'CREATED', user['created']))
     
     def save_user_data_legacy_format(self, data: str) -> bool:
         """Saves data in old colon-separated format"""
-        try:
-            parts = data.split(':')
-            if len(parts) >= 8:  # ID:1:NAME:John:EMAIL:john@example.com:CREATED:2023-01-15
-                user_data = {
-                    'id': int(parts[1]),
-                    'name': parts[3],
-                    'email': parts[5],
-                    'created': parts[7]
-                }
-                # Update existing user or add new one
-                for i, user in enumerate(self._data['users']):
-                    if user['id'] == user_data['id']:
-                        self._data['users'][i] = user_data
-                        return True
-                self._data['users'].append(user_data)
-                return True
-        except (ValueError, IndexError):
-            pass
-        return False
+        m = _LEGACY_RE.match(data)
+        if not m or m.group(4) is None:
+            return False
+        uid = int(m.group(1))
+        row = {'id': uid, 'name': m.group(2), 'email': m.group(3), 'created': m.group(4)}
+        # Update existing user or add new one
+        existing = self._by_id.get(uid)
+        if existing is None:
+            self._data['users'].append(row)
+            self._by_id[uid] = row
+        else:
+            existing.update(row)
+        return True
 
 class ModernAPI:
     """Simulates a modern REST API with JSON interface"""
@@ -77,66 +123,71 @@ class ModernAPI:
                 {'id': 2, 'name': 'Jane Smith', 'email': 'jane@example.com', 'created_at': '2023-02-20T00:00:00Z'}
             ]
         }
+        self._by_id: Dict[int, Dict[str, Any]] = {u['id']: u for u in self._data['users']}
+        self._next_id = max(self._by_id, default=0) + 1
     
     def get_user(self, user_id: int) -> Dict[str, Any]:
         """Returns user data as JSON dictionary"""
-        for user in self._data['users']:
-            if user['id'] == user_id:
-                return {
-                    'success': True,
-                    'data': user,
-                    'timestamp': datetime.now().isoformat()
-                }
+        user = self._by_id.get(user_id)
+        if user is not None:
+            return {
+                'success': True,
+                'data': user,
+                'timestamp': _now_iso()
+            }
         return {
             'success': False,
             'error': 'User not found',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
     
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Creates user and returns JSON response"""
         try:
             new_user = {
-                'id': max([u['id'] for u in self._data['users']]) + 1,
+                'id': self._next_id,
                 'name': user_data.get('name', ''),
                 'email': user_data.get('email', ''),
-                'created_at': datetime.now().isoformat() + 'Z'
+                'created_at': _now_iso() + 'Z'
             }
             self._data['users'].append(new_user)
+            self._by_id[new_user['id']] = new_user
+            self._next_id += 1
             return {
                 'success': True,
                 'data': new_user,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
 
 # ============================================================================
 # ADAPTER INTERFACES
 # ============================================================================
 
-class UserService(ABC):
-    """Modern user service interface"""
-    @abstractmethod
+class UserService(Protocol):
+    """Modern user service interface (structural - checked statically)"""
     def get_user(self, user_id: int) -> Dict[str, Any]:
-        pass
+        ...
     
-    @abstractmethod
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
-        pass
+        ...
 
 # ============================================================================
 # BIDIRECTIONAL ADAPTER (Interview focus: two-way adaptation)
 # ============================================================================
 
-class LegacyToModernAdapter(UserService):
+class LegacyToModernAdapter:
     """
     Adapter that makes Legacy Database compatible with Modern UserService interface
     Interview question: How to adapt legacy system to modern interface?
+    
+    Satisfies UserService structurally; subclassing the Protocol would bring
+    its metaclass (an ABCMeta subclass) back into every instantiation.
     """
     def __init__(self, legacy_db: LegacyDatabase):
         self._legacy_db = legacy_db
@@ -149,34 +200,32 @@ class LegacyToModernAdapter(UserService):
             return {
                 'success': False,
                 'error': 'User not found',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
         
         # Parse legacy colon-separated format
-        parts = legacy_data.split(':')
-        if len(parts) >= 8:
-            user_data = {
-                'id': int(parts[1]),
-                'name': parts[3],
-                'email': parts[5],
-                'created_at': parts[7] + 'T00:00:00Z'  # Convert to ISO format
-            }
+        m = _LEGACY_RE.match(legacy_data)
+        if m and m.group(4) is not None:
+            uid, name, email, created = m.groups()
+            # Build the response in one expression (created converted to ISO format)
             return {
                 'success': True,
-                'data': user_data,
-                'timestamp': datetime.now().isoformat()
+                'data': {'id': int(uid), 'name': name, 'email': email,
+                         'created_at': f"{created}T00:00:00Z"},
+                'timestamp': _now_iso()
             }
         
         return {
             'success': False,
             'error': 'Invalid data format',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
     
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert modern JSON format to legacy format and save"""
         # Convert modern format to legacy format
-        legacy_format = f"ID:0:NAME:{user_data.get('name', '')}:EMAIL:{user_data.get('email', '')}:CREATED:{datetime.now().strftime('%Y-%m-%d')}"
+        legacy_format = ':'.join(('ID', '0', 'NAME', str(user_data.get('name', '')),
+                                  'EMAIL', str(user_data.get('email', '')), 'CREATED', _today_iso()))
         
         success = self._legacy_db.save_user_data_legacy_format(legacy_format)
         
@@ -184,13 +233,13 @@ class LegacyToModernAdapter(UserService):
             return {
                 'success': True,
                 'data': user_data,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
         else:
             return {
                 'success': False,
                 'error': 'Failed to save user',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
 
 class ModernToLegacyAdapter:
@@ -198,35 +247,52 @@ class ModernToLegacyAdapter:
     Adapter that makes Modern API compatible with Legacy Database interface
     Interview question: How to adapt modern system to legacy interface?
     """
+    # Bounded LRU of recent misses (user_id -> expiry) so bursts of lookups for
+    # unknown ids skip the API round trip
+    NEGATIVE_CACHE_SIZE = 1024
+    NEGATIVE_CACHE_TTL = 1.0  # seconds
+    
     def __init__(self, modern_api: ModernAPI):
         self._modern_api = modern_api
+        self._not_found: OrderedDict = OrderedDict()
     
     def fetch_user_data_legacy_format(self, user_id: int) -> str:
         """Convert modern JSON format to legacy colon-separated format"""
+        expires = self._not_found.get(user_id)
+        if expires is not None:
+            if time.monotonic() < expires:
+                self._not_found.move_to_end(user_id)
+                return "USER_NOT_FOUND"
+            del self._not_found[user_id]
+        
         response = self._modern_api.get_user(user_id)
         
         if not response['success']:
+            self._not_found[user_id] = time.monotonic() + self.NEGATIVE_CACHE_TTL
+            if len(self._not_found) > self.NEGATIVE_CACHE_SIZE:
+                self._not_found.popitem(last=False)
             return "USER_NOT_FOUND"
         
         user_data = response['data']
         # Convert ISO timestamp to simple date
         created_date = user_data['created_at'][:10]  # Extract YYYY-MM-DD
         
-        return f"ID:{user_data['id']}:NAME:{user_data['name']}:EMAIL:{user_data['email']}:CREATED:{created_date}"
+        return ':'.join(('ID', str(user_data['id']), 'NAME', user_data['name'],
+                         'EMAIL', user_data['email'], 'CREATED', created_date))
     
     def save_user_data_legacy_format(self, data: str) -> bool:
         """Convert legacy format to modern JSON and save"""
-        try:
-            parts = data.split(':')
-            if len(parts) >= 8:
-                user_data = {
-                    'name': parts[3],
-                    'email': parts[5]
-                }
-                response = self._modern_api.create_user(user_data)
-                return response['success']
-        except (ValueError, IndexError):
-            pass
+        m = _LEGACY_RE.match(data)
+        if m and m.group(4) is not None:
+            user_data = {
+                'name': m.group(2),
+                'email': m.group(3)
+            }
+            response = self._modern_api.create_user(user_data)
+            if response['success']:
+                # The new id may have been cached as a miss
+                self._not_found.pop(response['data']['id'], None)
+            return response['success']
         return False
 
 # ============================================================================
@@ -239,62 +305,92 @@ class UniversalDataAdapter:
     Interview question: How to handle different data formats in one adapter?
     """
     def __init__(self):
-        self._format_handlers = {
-            'json': self._handle_json,
-            'xml': self._handle_xml,
-            'csv': self._handle_csv,
-            'legacy': self._handle_legacy
+        parsers: Dict[str, Callable[[str], Dict]] = {
+            'json': self._from_json,
+            'xml': self._from_xml,
+            'csv': self._from_csv,
+            'legacy': self._from_legacy
+        }
+        formatters: Dict[str, Callable[[Dict], str]] = {
+            'json': self._to_json,
+            'xml': self._to_xml,
+            'csv': self._to_csv,
+            'legacy': self._to_legacy
+        }
+        self._formats = frozenset(parsers)
+        # Every (source, target) pair specialized once into a direct callable
+        self._pipelines: Dict[Tuple[str, str], Callable[[str], str]] = {
+            (src, dst): self._compose(parse, fmt)
+            for src, parse in parsers.items()
+            for dst, fmt in formatters.items()
         }
     
-    def convert_data(self, data: str, from_format: str, to_format: str) -> str:
-        """Convert data between different formats"""
-        if from_format not in self._format_handlers:
-            raise ValueError(f"Unsupported source format: {from_format}")
-        
-        if to_format not in self._format_handlers:
-            raise ValueError(f"Unsupported target format: {to_format}")
-        
-        # Parse from source format
-        parsed_data = self._format_handlers[from_format](data)
-        
-        # Convert to target format
-        return self._format_handlers[to_format](parsed_data, reverse=True)
+    @staticmethod
+    def _compose(parse: Callable[[str], Dict], fmt: Callable[[Dict], str]) -> Callable[[str], str]:
+        """Fuse a parser and a formatter into a single conversion function"""
+        def pipeline(data: str) -> str:
+            return fmt(parse(data))
+        return pipeline
     
-    def _handle_json(self, data: Union[str, Dict], reverse: bool = False) -> Union[Dict, str]:
-        if reverse:
-            return json.dumps(data, indent=2)
-        return json.loads(data)
-    
-    def _handle_xml(self, data: Union[str, Dict], reverse: bool = False) -> Union[Dict, str]:
-        if reverse:
-            root = ET.Element("user")
-            for key, value in data.items():
-                child = ET.SubElement(root, key)
-                child.text = str(value)
-            return ET.tostring(root, encoding='unicode')
-        else:
-            root = ET.fromstring(data)
-            return {child.tag: child.text for child in root}
+    def convert_data(self, data: Union[str, bytes], from_format: str, to_format: str) -> Union[str, bytes]:
+        """Convert data between different formats (bytes in, bytes out)"""
+        try:
+            pipeline = self._pipelines[(from_format, to_format)]
+        except KeyError:
+            if from_format not in self._formats:
+                raise ValueError(f"Unsupported source format: {from_format}") from None
+            raise ValueError(f"Unsupported target format: {to_format}") from None
+        
+        if isinstance(data, bytes):
+            # Decode/encode once at the boundary; ASCII payloads stay 1 byte per char
+            return pipeline(data.decode('utf-8')).encode('utf-8')
+        return pipeline(data)
+    
+    def _from_json(self, data: str) -> Dict:
+        return _json_loads(data)
+    
+    def _to_json(self, data: Dict) -> str:
+        return _json_dumps(data)
+    
+    def _from_xml(self, data: str) -> Dict:
+        # Skip the general parser only when the whole document is a flat record
+        if _XML_RECORD_RE.fullmatch(data):
+            return {tag: unescape(text) for tag, text in _XML_RE.findall(data)}
+        # Anything outside the flat shape goes through the real parser
+        root = ET.fromstring(data)
+        return {child.tag: child.text for child in root}
+    
+    def _to_xml(self, data: Dict) -> str:
+        if tuple(data) == _XML_USER_FIELDS:
+            return _XML_USER_TEMPLATE.format(escape(str(data['id'])),
+                                             escape(str(data['name'])),
+                                             escape(str(data['email'])))
+        return '<user>' + ''.join(f'<{k}>{escape(str(v))}</{k}>' for k, v in data.items()) + '</user>'
+    
+    def _from_csv(self, data: str) -> Dict:
+        # Only the header and first row are used - partition instead of splitting every line
+        header, _, rest = data.strip().partition('\n')
+        row = rest.partition('\n')[0]
+        return dict(zip(header.split(','), row.split(',')))
+    
+    def _to_csv(self, data: Dict) -> str:
+        return f"id,name,email\n{data['id']},{data['name']},{data['email']}"
+    
+    def _from_legacy(self, data: str) -> Dict:
+        # Locate the field markers once and slice between them - no split list
+        i1 = data.find(':NAME:', 3)
+        i2 = data.find(':EMAIL:', i1 + 6)
+        if not data.startswith('ID:') or i1 < 0 or i2 < 0:
+            raise ValueError(f"Invalid legacy record: {data!r}")
+        i3 = data.find(':CREATED:', i2 + 7)
+        return {
+            'id': int(data[3:i1]),
+            'name': data[i1 + 6:i2],
+            'email': data[i2 + 7:] if i3 < 0 else data[i2 + 7:i3]
+        }
     
-    def _handle_csv(self, data: Union[str, Dict], reverse: bool = False) -> Union[Dict, str]:
-        if reverse:
-            return f"id,name,email\n{data['id']},{data['name']},{data['email']}"
-        else:
-            lines = data.strip().split('\n')
-            headers = lines[0].split(',')
-            values = lines[1].split(',')
-            return dict(zip(headers, values))
-    
-    def _handle_legacy(self, data: Union[str, Dict], reverse: bool = False) -> Union[Dict, str]:
-        if reverse:
-            return f"ID:{data['id']}:NAME:{data['name']}:EMAIL:{data['email']}"
-        else:
-            parts = data.split(':')
-            return {
-                'id': int(parts[1]),
-                'name': parts[3],
-                'email': parts[5]
-            }
+    def _to_legacy(self, data: Dict) -> str:
+        return ':'.join(('ID', str(data['id']), 'NAME', str(data['name']), 'EMAIL', str(data['email'])))
 
 # ============================================================================
 # CLIENT CODE
@@ -311,10 +407,10 @@ class UserServiceClient:
         
         if response['success']:
             user = response['data']
-            print(f"👤 User ID: {user['id']}")
-            print(f"   Name: {user['name']}")
-            print(f"   Email: {user['email']}")
-            print(f"   Created: {user['created_at']}")
+            print(f"👤 User ID: {user['id']}\n"
+                  f"   Name: {user['name']}\n"
+                  f"   Email: {user['email']}\n"
+                  f"   Created: {user['created_at']}")
         else:
             print(f"❌ Error: {response['error']}")
     
@@ -328,27 +424,34 @@ class UserServiceClient:
         else:
             print(f"❌ Failed to create user: {response['error']}")
 
+_DEMO_HEADER = """
+============================================================
+🚀 ADAPTER PATTERN - INTERVIEW DEMO
+============================================================
+
+💡 Common interview questions:
+1. How to integrate with a legacy system you can't modify?
+2. What if you need two-way adaptation?
+3. How to handle different data formats?
+4. How to make incompatible interfaces work together?"""
+
+def _section(title: str) -> str:
+    """Section banner as a single string"""
+    rule = "=" * 50
+    return f"\n{rule}\n{title}\n{rule}"
+
 def demo_adapter_interview():
     """
     🎯 INTERVIEW DEMO: Adapter Pattern
     Demonstrates legacy integration and bidirectional adaptation
     """
-    print("\n" + "="*60)
-    print("🚀 ADAPTER PATTERN - INTERVIEW DEMO")
-    print("="*60)
-    
-    print("\n💡 Common interview questions:")
-    print("1. How to integrate with a legacy system you can't modify?")
-    print("2. What if you need two-way adaptation?")
-    print("3. How to handle different data formats?")
-    print("4. How to make incompatible interfaces work together?")
+    # Static banner blocks are emitted with one write each
+    print(_DEMO_HEADER)
     
     # ========================================================================
     # LEGACY TO MODERN ADAPTER DEMO
     # ========================================================================
-    print("\n" + "="*50)
-    print("🔄 LEGACY TO MODERN ADAPTER DEMO")
-    print("="*50)
+    print(_section("🔄 LEGACY TO MODERN ADAPTER DEMO"))
     
     # Create systems
     legacy_db = LegacyDatabase()
@@ -371,17 +474,14 @@ def demo_adapter_interview():
     # ========================================================================
     # MODERN TO LEGACY ADAPTER DEMO
     # ========================================================================
-    print("\n" + "="*50)
-    print("🔄 MODERN TO LEGACY ADAPTER DEMO")
-    print("="*50)
+    print(_section("🔄 MODERN TO LEGACY ADAPTER DEMO"))
     
     # Create reverse adapter
     modern_adapter = ModernToLegacyAdapter(modern_api)
     
-    print("\n📖 Reading users from modern system in legacy format:")
-    print(f"User 1: {modern_adapter.fetch_user_data_legacy_format(1)}")
-    print(f"User 2: {modern_adapter.fetch_user_data_legacy_format(2)}")
-    print(f"User 999: {modern_adapter.fetch_user_data_legacy_format(999)}")
+    print("\n📖 Reading users from modern system in legacy format:\n" +
+          "\n".join(f"User {uid}: {modern_adapter.fetch_user_data_legacy_format(uid)}"
+                    for uid in (1, 2, 999)))
     
     print("\n✏️ Creating user in modern system via legacy format:")
     legacy_data = "ID:0:NAME:Alice Johnson:EMAIL:alice@example.com:CREATED:2023-12-01"
@@ -391,9 +491,7 @@ def demo_adapter_interview():
     # ========================================================================
     # UNIVERSAL DATA ADAPTER DEMO
     # ========================================================================
-    print("\n" + "="*50)
-    print("🌐 UNIVERSAL DATA ADAPTER DEMO")
-    print("="*50)
+    print(_section("🌐 UNIVERSAL DATA ADAPTER DEMO"))
     
     universal_adapter = UniversalDataAdapter()
     
@@ -403,23 +501,31 @@ def demo_adapter_interview():
     csv_data = 'id,name,email\n1,John Doe,john@example.com'
     legacy_data = 'ID:1:NAME:John Doe:EMAIL:john@example.com'
     
-    print("\n🔄 Converting between different formats:")
-    
     # JSON to XML
     xml_result = universal_adapter.convert_data(json_data, 'json', 'xml')
-    print(f"JSON → XML:\n{xml_result}")
     
     # XML to CSV
     csv_result = universal_adapter.convert_data(xml_data, 'xml', 'csv')
-    print(f"\nXML → CSV:\n{csv_result}")
     
     # CSV to Legacy
     legacy_result = universal_adapter.convert_data(csv_data, 'csv', 'legacy')
-    print(f"\nCSV → Legacy:\n{legacy_result}")
     
     # Legacy to JSON
     json_result = universal_adapter.convert_data(legacy_data, 'legacy', 'json')
-    print(f"\nLegacy → JSON:\n{json_result}")
+    
+    print(f"""
+🔄 Converting between different formats:
+JSON → XML:
+{xml_result}
+
+XML → CSV:
+{csv_result}
+
+CSV → Legacy:
+{legacy_result}
+
+Legacy → JSON:
+{json_result}""")
 
 if __name__ == "__main__":
     demo_adapter_interview()
@@ -18,18 +18,42 @@ representations.
 - Different object representations
 '''
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Union
+from collections import OrderedDict
 from datetime import datetime
+import copy
 import json
+import re
+import sys
 
 # ============================================================================
 # COMPUTER BUILDER EXAMPLE
 # ============================================================================
 
+# Component price tables (built once, shared by every calculate_price call)
+_CPU_PRICES = {
+    "Intel i3": 150, "Intel i5": 250, "Intel i7": 400, "Intel i9": 600,
+    "AMD Ryzen 3": 120, "AMD Ryzen 5": 200, "AMD Ryzen 7": 350, "AMD Ryzen 9": 500
+}
+
+_GPU_PRICES = {
+    "Integrated": 0, "GTX 1660": 200, "RTX 3060": 400, "RTX 3070": 600,
+    "RTX 3080": 800, "RTX 4090": 1200
+}
+
+_ACCESSORY_PRICES = {
+    "Keyboard": 50, "Mouse": 30, "Monitor": 200, "Webcam": 80,
+    "Speakers": 60, "Headset": 100
+}
+
 class Computer:
     """Product class - Complex computer object"""
     
+    # Fixed attribute set - no per-instance __dict__
+    __slots__ = ('cpu', 'memory', 'storage', 'graphics_card', 'motherboard',
+                 'power_supply', 'case', 'cooling_system', 'operating_system',
+                 'accessories', 'price', 'warranty_years')
+    
     def __init__(self):
         self.cpu = ""
         self.memory = 0
@@ -40,7 +64,8 @@ class Computer:
         self.case = ""
         self.cooling_system = ""
         self.operating_system = ""
-        self.accessories: List[str] = []
+        # List while building; ComputerBuilder.build() returns a copy holding a tuple
+        self.accessories: Union[List[str], Tuple[str, ...]] = []
         self.price = 0.0
         self.warranty_years = 1
     
@@ -64,23 +89,25 @@ class Computer:
     def display_specs(self) -> str:
         """Display computer specifications"""
         specs = self.get_specifications()
-        result = "🖥️ Computer Specifications:\n"
-        result += f"   CPU: {specs['cpu']}\n"
-        result += f"   Memory: {specs['memory_gb']} GB\n"
-        result += f"   Storage: {specs['storage_gb']} GB\n"
-        result += f"   Graphics: {specs['graphics_card']}\n"
-        result += f"   Motherboard: {specs['motherboard']}\n"
-        result += f"   Power Supply: {specs['power_supply']}\n"
-        result += f"   Case: {specs['case']}\n"
-        result += f"   Cooling: {specs['cooling_system']}\n"
-        result += f"   OS: {specs['operating_system']}\n"
-        result += f"   Accessories: {', '.join(specs['accessories']) if specs['accessories'] else 'None'}\n"
-        result += f"   Price: ${specs['price']:,.2f}\n"
-        result += f"   Warranty: {specs['warranty_years']} years"
-        return result
+        # Built as one string so callers print it with a single write
+        return "\n".join((
+            "🖥️ Computer Specifications:",
+            f"   CPU: {specs['cpu']}",
+            f"   Memory: {specs['memory_gb']} GB",
+            f"   Storage: {specs['storage_gb']} GB",
+            f"   Graphics: {specs['graphics_card']}",
+            f"   Motherboard: {specs['motherboard']}",
+            f"   Power Supply: {specs['power_supply']}",
+            f"   Case: {specs['case']}",
+            f"   Cooling: {specs['cooling_system']}",
+            f"   OS: {specs['operating_system']}",
+            f"   Accessories: {', '.join(specs['accessories']) if specs['accessories'] else 'None'}",
+            f"   Price: ${specs['price']:,.2f}",
+            f"   Warranty: {specs['warranty_years']} years",
+        ))
 
-class ComputerBuilder(ABC):
-    """Abstract builder interface"""
+class ComputerBuilder:
+    """Base builder interface - concrete builders override the required setters"""
     
     def __init__(self):
         self.computer = Computer()
@@ -91,25 +118,21 @@ class ComputerBuilder(ABC):
         self.computer = Computer()
         return self
     
-    @abstractmethod
     def set_cpu(self, cpu: str):
         """Set CPU"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def set_memory(self, memory_gb: int):
         """Set memory"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def set_storage(self, storage_gb: int):
         """Set storage"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def set_graphics_card(self, graphics_card: str):
         """Set graphics card"""
-        pass
+        raise NotImplementedError
     
     def set_motherboard(self, motherboard: str):
         """Set motherboard (optional)"""
@@ -141,6 +164,11 @@ class ComputerBuilder(ABC):
         self.computer.accessories.append(accessory)
         return self
     
+    def add_accessories(self, *accessories: str):
+        """Add several accessories in one call"""
+        self.computer.accessories.extend(accessories)
+        return self
+    
     def set_warranty(self, years: int):
         """Set warranty period"""
         self.computer.warranty_years = years
@@ -152,11 +180,7 @@ class ComputerBuilder(ABC):
         base_price = 500  # Base system price
         
         # CPU pricing
-        cpu_prices = {
-            "Intel i3": 150, "Intel i5": 250, "Intel i7": 400, "Intel i9": 600,
-            "AMD Ryzen 3": 120, "AMD Ryzen 5": 200, "AMD Ryzen 7": 350, "AMD Ryzen 9": 500
-        }
-        base_price += cpu_prices.get(self.computer.cpu, 200)
+        base_price += _CPU_PRICES.get(self.computer.cpu, 200)
         
         # Memory pricing
         base_price += self.computer.memory * 10  # $10 per GB
@@ -165,19 +189,10 @@ class ComputerBuilder(ABC):
         base_price += self.computer.storage * 0.1  # $0.10 per GB
         
         # Graphics card pricing
-        gpu_prices = {
-            "Integrated": 0, "GTX 1660": 200, "RTX 3060": 400, "RTX 3070": 600,
-            "RTX 3080": 800, "RTX 4090": 1200
-        }
-        base_price += gpu_prices.get(self.computer.graphics_card, 300)
+        base_price += _GPU_PRICES.get(self.computer.graphics_card, 300)
         
         # Accessories pricing
-        accessory_prices = {
-            "Keyboard": 50, "Mouse": 30, "Monitor": 200, "Webcam": 80,
-            "Speakers": 60, "Headset": 100
-        }
-        for accessory in self.computer.accessories:
-            base_price += accessory_prices.get(accessory, 25)
+        base_price += sum(_ACCESSORY_PRICES.get(a, 25) for a in self.computer.accessories)
         
         self.computer.price = base_price
         return self
@@ -188,7 +203,16 @@ class ComputerBuilder(ABC):
             raise ValueError("Invalid computer configuration")
         
         self.calculate_price()
-        return self.computer
+        # The product gets a frozen copy; the builder keeps its list so it can
+        # still be extended and built again
+        product = copy.copy(self.computer)
+        product.accessories = tuple(self.computer.accessories)
+        return product
+    
+    def _load(self, computer: Computer):
+        """Continue building from a copy of an existing computer"""
+        self.computer = copy.copy(computer)
+        self.computer.accessories = list(computer.accessories)
     
     def _validate_build(self) -> bool:
         """Validate the computer configuration"""
@@ -281,11 +305,49 @@ class OfficeComputerBuilder(ComputerBuilder):
 class ComputerDirector:
     """Director class that orchestrates the building process"""
     
+    # Finished product of each (recipe, builder class) - recipes never change,
+    # so later builds copy the template instead of replaying every setter
+    _templates: Dict[Tuple[str, type], Computer] = {}
+    
     def __init__(self, builder: ComputerBuilder):
         self.builder = builder
     
-    def build_budget_gaming_pc(self) -> Computer:
-        """Build a budget gaming PC"""
+    def _build_from_template(self, recipe: str, build: Callable[[], Computer],
+                             overrides: Dict[str, Any]) -> Computer:
+        """Return a copy of the recipe's template, running the recipe on first use"""
+        key = (recipe, type(self.builder))
+        template = self._templates.get(key)
+        # Shallow copies are enough: built computers hold accessories as a tuple
+        if template is None:
+            computer = build()
+            self._templates[key] = copy.copy(computer)
+        else:
+            computer = copy.copy(template)
+            self.builder._load(computer)
+        
+        if overrides:
+            for field, value in overrides.items():
+                setattr(computer, field, value)
+            computer.accessories = tuple(computer.accessories)
+            self.builder._load(computer)
+            self.builder.calculate_price()
+            computer.price = self.builder.computer.price
+        return computer
+    
+    def build_budget_gaming_pc(self, **overrides: Any) -> Computer:
+        """Build a budget gaming PC (keyword arguments override template fields)"""
+        return self._build_from_template("budget_gaming", self._budget_gaming_recipe, overrides)
+    
+    def build_high_end_gaming_pc(self, **overrides: Any) -> Computer:
+        """Build a high-end gaming PC (keyword arguments override template fields)"""
+        return self._build_from_template("high_end_gaming", self._high_end_gaming_recipe, overrides)
+    
+    def build_office_workstation(self, **overrides: Any) -> Computer:
+        """Build an office workstation (keyword arguments override template fields)"""
+        return self._build_from_template("office_workstation", self._office_workstation_recipe, overrides)
+    
+    def _budget_gaming_recipe(self) -> Computer:
+        """Budget gaming PC build steps"""
         return (self.builder.reset()
                 .set_cpu("AMD Ryzen 5")
                 .set_memory(16)
@@ -296,13 +358,12 @@ class ComputerDirector:
                 .set_case("Mid Tower ATX")
                 .set_cooling_system("Air Cooling")
                 .set_operating_system("Windows 11")
-                .add_accessory("Keyboard")
-                .add_accessory("Mouse")
+                .add_accessories("Keyboard", "Mouse")
                 .set_warranty(2)
                 .build())
     
-    def build_high_end_gaming_pc(self) -> Computer:
-        """Build a high-end gaming PC"""
+    def _high_end_gaming_recipe(self) -> Computer:
+        """High-end gaming PC build steps"""
         return (self.builder.reset()
                 .set_cpu("Intel i9")
                 .set_memory(32)
@@ -313,15 +374,13 @@ class ComputerDirector:
                 .set_case("Full Tower ATX")
                 .set_cooling_system("Liquid Cooling")
                 .set_operating_system("Windows 11 Pro")
-                .add_accessory("Mechanical Keyboard")
-                .add_accessory("Gaming Mouse")
-                .add_accessory("Gaming Monitor")
-                .add_accessory("Gaming Headset")
+                .add_accessories("Mechanical Keyboard", "Gaming Mouse",
+                                 "Gaming Monitor", "Gaming Headset")
                 .set_warranty(3)
                 .build())
     
-    def build_office_workstation(self) -> Computer:
-        """Build an office workstation"""
+    def _office_workstation_recipe(self) -> Computer:
+        """Office workstation build steps"""
         return (self.builder.reset()
                 .set_cpu("Intel i5")
                 .set_memory(16)
@@ -332,9 +391,7 @@ class ComputerDirector:
                 .set_case("Mini Tower")
                 .set_cooling_system("Stock Cooling")
                 .set_operating_system("Windows 11 Pro")
-                .add_accessory("Keyboard")
-                .add_accessory("Mouse")
-                .add_accessory("Monitor")
+                .add_accessories("Keyboard", "Mouse", "Monitor")
                 .set_warranty(3)
                 .build())
 
@@ -342,8 +399,144 @@ class ComputerDirector:
 # SQL QUERY BUILDER EXAMPLE
 # ============================================================================
 
+def _render_sql(query_type: str, table: str, columns: Tuple[str, ...],
+                join_clauses: Tuple[str, ...], where_conditions: Tuple[str, ...],
+                group_by: Tuple[str, ...], having_conditions: Tuple[str, ...],
+                order_by: Tuple[str, ...], limit_value: Any, offset_value: Any) -> str:
+    """Render SQL from hashable query parts (cached by SQLQuery.to_template)"""
+    # One flat token list and a single final join - keywords are separate
+    # tokens, so no intermediate "KEYWORD clause" strings are built
+    parts: List[str] = []
+    append = parts.append
+    
+    # SELECT clause
+    if query_type.upper() == "SELECT":
+        append("SELECT")
+        append(", ".join(columns) if columns else "*")
+    
+    # FROM clause
+    if table:
+        append("FROM")
+        append(table)
+    
+    # JOIN clauses (pre-formatted by the builder)
+    parts.extend(join_clauses)
+    
+    # WHERE clause
+    if where_conditions:
+        append("WHERE")
+        append(" AND ".join(where_conditions))
+    
+    # GROUP BY clause
+    if group_by:
+        append("GROUP BY")
+        append(", ".join(group_by))
+    
+    # HAVING clause
+    if having_conditions:
+        append("HAVING")
+        append(" AND ".join(having_conditions))
+    
+    # ORDER BY clause
+    if order_by:
+        append("ORDER BY")
+        append(", ".join(order_by))
+    
+    # LIMIT clause
+    if limit_value is not None:
+        append("LIMIT")
+        append(str(limit_value))
+    
+    # OFFSET clause
+    if offset_value is not None:
+        append("OFFSET")
+        append(str(offset_value))
+    
+    return " ".join(parts)
+
+# Per-clause (keyword, value expression) pairs used to generate shape renderers;
+# the expressions are evaluated against the SQLQuery bound to ``q``
+_SHAPE_CLAUSES = (
+    ("SELECT", '", ".join(q.columns)'),
+    ("FROM", "q.table"),
+    (None, '" ".join(q.join_clauses)'),
+    ("WHERE", '" AND ".join(sorted(q.where_conditions))'),
+    ("GROUP BY", '", ".join(q.group_by)'),
+    ("HAVING", '" AND ".join(sorted(q.having_conditions))'),
+    ("ORDER BY", '", ".join(q.order_by)'),
+    ("LIMIT", "str(q.limit_value)"),
+    ("OFFSET", "str(q.offset_value)"),
+)
+
+# Generated renderers keyed by query shape (see SQLQuery._shape_key)
+_RENDERERS: Dict[tuple, Callable[["SQLQuery"], str]] = {}
+
+def _compile_renderer(shape: tuple) -> Callable[["SQLQuery"], str]:
+    """Generate a renderer that emits exactly the clauses present in ``shape``
+    
+    The clause checks of _render_sql are decided once here; the generated
+    function is a single string concatenation with no branches.
+    """
+    terms: List[str] = []
+    literal = ""
+    for (keyword, expr), present in zip(_SHAPE_CLAUSES, shape[1:]):
+        if not present:
+            continue
+        if keyword == "SELECT" and not shape[0]:
+            expr = '"*"'  # SELECT without explicit columns
+        if keyword:
+            literal += (" " if terms or literal else "") + keyword + " "
+        elif terms or literal:
+            literal += " "
+        if literal:
+            terms.append(repr(literal))
+            literal = ""
+        terms.append(expr)
+    
+    source = f"def render(q):\n    return {' + '.join(terms) or repr('')}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<sql renderer {shape}>", "exec"), namespace)
+    return namespace["render"]
+
+# Quoted strings and bare numbers inside conditions - replaced by '?' in fingerprints
+_SQL_LITERAL_RE = re.compile(r"'[^']*'|\b\d+\b")
+
+# Simple "operand op operand" predicates, and the operator seen from the other side
+_PREDICATE_RE = re.compile(r"^\s*([^\s<>=!]+)\s*(<=|>=|<>|!=|=|<|>)\s*([^\s<>=!]+)\s*$")
+_REVERSED_OPS = {'<': '>', '>': '<', '<=': '>=', '>=': '<=', '=': '=', '!=': '!=', '<>': '<>'}
+
+# Identifiers up to this length are interned: tables and columns repeat across
+# queries, so equal names share one object and hash/compare by identity first
+_INTERN_MAX_LEN = 64
+
+def _intern(name: str) -> str:
+    """sys.intern() short identifier strings, pass longer ones through"""
+    return sys.intern(name) if len(name) <= _INTERN_MAX_LEN else name
+
+def _normalize_predicate(condition: str) -> str:
+    """Canonical 'column op constant' form of a simple comparison
+    
+    '18 < age' becomes 'age > 18' and stray whitespace is dropped, so
+    equivalent conditions render and fingerprint identically. Anything more
+    complex than a single comparison is only stripped. Short results are
+    interned, since the same predicates recur across many queries.
+    """
+    match = _PREDICATE_RE.match(condition)
+    if not match:
+        return _intern(condition.strip())
+    left, op, right = match.groups()
+    if _SQL_LITERAL_RE.fullmatch(left) and not _SQL_LITERAL_RE.fullmatch(right):
+        left, op, right = right, _REVERSED_OPS[op], left
+    return _intern(f"{left} {op} {right}")
+
 class SQLQuery:
     """Product class - SQL Query object"""
+    __slots__ = ('query_type', 'table', 'columns', 'where_conditions', 'join_clauses', 'group_by',
+                 'having_conditions', 'order_by', 'limit_value', 'offset_value')
+    
+    # Parameterized SQL per structural fingerprint, evicted least recently used
+    _TEMPLATE_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+    TEMPLATE_CACHE_SIZE = 1000
     
     def __init__(self):
         self.query_type = ""
@@ -359,53 +552,55 @@ class SQLQuery:
     
     def to_string(self) -> str:
         """Convert query to SQL string"""
-        query_parts = []
-        
-        # SELECT clause
-        if self.query_type.upper() == "SELECT":
-            columns = ", ".join(self.columns) if self.columns else "*"
-            query_parts.append(f"SELECT {columns}")
-        
-        # FROM clause
-        if self.table:
-            query_parts.append(f"FROM {self.table}")
-        
-        # JOIN clauses
-        for join in self.join_clauses:
-            query_parts.append(join)
-        
-        # WHERE clause
-        if self.where_conditions:
-            where_clause = " AND ".join(self.where_conditions)
-            query_parts.append(f"WHERE {where_clause}")
-        
-        # GROUP BY clause
-        if self.group_by:
-            group_clause = ", ".join(self.group_by)
-            query_parts.append(f"GROUP BY {group_clause}")
+        # AND-ed conditions are order independent and always rendered sorted,
+        # so the text matches to_template() and is stable across call order
+        shape = self._shape_key()
+        renderer = _RENDERERS.get(shape)
+        if renderer is None:
+            renderer = _RENDERERS[shape] = _compile_renderer(shape)
+        return renderer(self)
+    
+    def _shape_key(self) -> tuple:
+        """Which clauses are present (the first flag: explicit SELECT columns)"""
+        return (bool(self.columns),
+                self.query_type.upper() == "SELECT",
+                bool(self.table),
+                bool(self.join_clauses),
+                bool(self.where_conditions),
+                bool(self.group_by),
+                bool(self.having_conditions),
+                bool(self.order_by),
+                self.limit_value is not None,
+                self.offset_value is not None)
+    
+    def _fingerprint(self) -> tuple:
+        """Structural key: the query with every literal value replaced by '?'"""
+        return (self.query_type, self.table, tuple(self.columns),
+                tuple(self.join_clauses),
+                tuple(_SQL_LITERAL_RE.sub("?", c) for c in sorted(self.where_conditions)),
+                tuple(self.group_by),
+                tuple(_SQL_LITERAL_RE.sub("?", c) for c in sorted(self.having_conditions)),
+                tuple(self.order_by),
+                None if self.limit_value is None else "?",
+                None if self.offset_value is None else "?")
+    
+    def to_template(self) -> str:
+        """Parameterized SQL shared by all structurally identical queries"""
+        key = self._fingerprint()
+        cache = SQLQuery._TEMPLATE_CACHE
+        template = cache.get(key)
+        if template is not None:
+            cache.move_to_end(key)
+            return template
         
-        # HAVING clause
-        if self.having_conditions:
-            having_clause = " AND ".join(self.having_conditions)
-            query_parts.append(f"HAVING {having_clause}")
-        
-        # ORDER BY clause
-        if self.order_by:
-            order_clause = ", ".join(self.order_by)
-            query_parts.append(f"ORDER BY {order_clause}")
-        
-        # LIMIT clause
-        if self.limit_value is not None:
-            query_parts.append(f"LIMIT {self.limit_value}")
-        
-        # OFFSET clause
-        if self.offset_value is not None:
-            query_parts.append(f"OFFSET {self.offset_value}")
-        
-        return " ".join(query_parts)
+        template = cache[key] = _render_sql(*key)
+        if len(cache) > self.TEMPLATE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return template
 
 class SQLQueryBuilder:
     """Builder for SQL queries"""
+    __slots__ = ('query',)
     
     def __init__(self):
         self.query = SQLQuery()
@@ -419,17 +614,22 @@ class SQLQueryBuilder:
     def select(self, *columns: str):
         """Add SELECT clause"""
         self.query.query_type = "SELECT"
-        self.query.columns.extend(columns)
+        self.query.columns.extend(map(_intern, columns))
         return self
     
     def from_table(self, table: str):
         """Add FROM clause"""
-        self.query.table = table
+        self.query.table = _intern(table)
         return self
     
     def where(self, condition: str):
         """Add WHERE condition"""
-        self.query.where_conditions.append(condition)
+        self.query.where_conditions.append(_normalize_predicate(condition))
+        return self
+    
+    def where_all(self, *conditions: str):
+        """Add several WHERE conditions at once"""
+        self.query.where_conditions.extend(map(_normalize_predicate, conditions))
         return self
     
     def join(self, table: str, condition: str, join_type: str = "INNER"):
@@ -438,19 +638,30 @@ class SQLQueryBuilder:
         self.query.join_clauses.append(join_clause)
         return self
     
+    def join_all(self, *joins: Tuple[str, str], join_type: str = "INNER"):
+        """Add several (table, condition) JOIN clauses of one type at once"""
+        self.query.join_clauses.extend(
+            f"{join_type} JOIN {table} ON {condition}" for table, condition in joins)
+        return self
+    
     def group_by(self, *columns: str):
         """Add GROUP BY clause"""
-        self.query.group_by.extend(columns)
+        self.query.group_by.extend(map(_intern, columns))
         return self
     
     def having(self, condition: str):
         """Add HAVING condition"""
-        self.query.having_conditions.append(condition)
+        self.query.having_conditions.append(_normalize_predicate(condition))
+        return self
+    
+    def having_all(self, *conditions: str):
+        """Add several HAVING conditions at once"""
+        self.query.having_conditions.extend(map(_normalize_predicate, conditions))
         return self
     
     def order_by(self, *columns: str):
         """Add ORDER BY clause"""
-        self.query.order_by.extend(columns)
+        self.query.order_by.extend(map(_intern, columns))
         return self
     
     def limit(self, count: int):
@@ -467,6 +678,10 @@ class SQLQueryBuilder:
         """Build and return the query"""
         if not self._validate_query():
             raise ValueError("Invalid SQL query")
+        # Canonical AND order, so the built query compares and hashes equal
+        # however its conditions were chained
+        self.query.where_conditions.sort()
+        self.query.having_conditions.sort()
         return self.query
     
     def _validate_query(self) -> bool:
@@ -541,9 +756,7 @@ def demo_builder_interview():
                 .set_case("Full Tower")
                 .set_cooling_system("Liquid Cooling")
                 .set_operating_system("Windows 11 Pro")
-                .add_accessory("Mechanical Keyboard")
-                .add_accessory("Gaming Mouse")
-                .add_accessory("Monitor")
+                .add_accessories("Mechanical Keyboard", "Gaming Mouse", "Monitor")
                 .set_warranty(3)
                 .build())
     print(custom_pc.display_specs())
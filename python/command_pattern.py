@@ -19,43 +19,126 @@ support undoable operations.
 - Command history management
 '''
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Deque, Iterable, Protocol, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
+import logging
+import operator
+import os
+import re
+import sys
 import time
+import zlib
+
+# Per-command diagnostics go through logging at DEBUG level: when nobody has
+# enabled it they cost a level check instead of a formatted write to stdout
+logger = logging.getLogger(__name__)
+
+# History entries are (command, type_code, monotonic_ns) tuples; dicts with a
+# wall-clock datetime are only built when the history is read
+_HISTORY_TYPES = ('execute', 'undo', 'redo')
+_HISTORY_PREFIXES = ('', 'UNDO: ', 'REDO: ')
+_EXECUTE, _UNDO, _REDO = range(3)
+# Offset turning monotonic_ns() readings into wall-clock epoch nanoseconds
+_WALL_CLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+# Deleted text at least this long is kept zlib-compressed in undo records
+_COMPRESS_MIN_CHARS = 1024
+
+# Document edit log entries are (op_code, first, second) tuples, formatted
+# with these templates only when Document.get_history() is called
+_DOC_INSERT, _DOC_DELETE, _DOC_REPLACE = range(3)
+_DOC_HISTORY_FORMATS = (
+    "Inserted '{}' at position {}",
+    "Deleted '{}' from position {}",
+    "Replaced '{}' with '{}'",
+)
 
 # ============================================================================
 # RECEIVER CLASSES (Objects that perform the actual work)
 # ============================================================================
 
 class Document:
-    """Document that can be edited"""
+    """Document that can be edited
+    
+    Text is kept in a gap buffer: characters before the gap in ``_left`` and
+    characters after it in ``_right`` (stored reversed). Edits move the gap to
+    the edit position and then touch only the edited characters, so a run of
+    edits near the cursor no longer copies the whole document each time.
+    """
+    __slots__ = ('name', '_left', '_right', '_content', 'cursor_position', 'history',
+                 '_track_history')
+    MAX_HISTORY = 100
+    
     def __init__(self, name: str = "Untitled"):
         self.name = name
-        self.content = ""
+        self._left: List[str] = []
+        self._right: List[str] = []
+        self._content: Optional[str] = ""  # joined text, None after an edit
         self.cursor_position = 0
-        self.history = []
+        self.history: Deque[Tuple[int, Any, Any]] = deque(maxlen=self.MAX_HISTORY)
+        self._track_history = False  # edit log is opt-in, see enable_history()
+    
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = "".join(self._left) + "".join(reversed(self._right))
+        return self._content
+    
+    @content.setter
+    def content(self, value: str):
+        self._left = list(value)
+        self._right = []
+        self._content = value
+    
+    def __len__(self) -> int:
+        return len(self._left) + len(self._right)
+    
+    def _move_gap(self, position: int):
+        """Move the gap so that exactly ``position`` characters precede it"""
+        left, right = self._left, self._right
+        if position < len(left):
+            right.extend(reversed(left[position:]))
+            del left[position:]
+        elif position > len(left):
+            count = position - len(left)
+            left.extend(reversed(right[-count:]))
+            del right[-count:]
     
     def insert_text(self, text: str, position: int) -> bool:
         """Insert text at specified position"""
-        if position < 0 or position > len(self.content):
+        return self._insert_text_fast(text, position, len(text))
+    
+    def _insert_text_fast(self, text: str, position: int, tlen: int) -> bool:
+        """insert_text() for callers that already know ``len(text)``"""
+        if position < 0 or position > len(self):
             return False
         
-        self.content = self.content[:position] + text + self.content[position:]
-        self.cursor_position = position + len(text)
-        self.history.append(f"Inserted '{text}' at position {position}")
+        self._move_gap(position)
+        self._left.extend(text)
+        self._content = None
+        self.cursor_position = position + tlen
+        if self._track_history:
+            self.history.append((_DOC_INSERT, text, position))
         return True
     
     def delete_text(self, position: int, length: int) -> str:
         """Delete text starting at position"""
-        if position < 0 or position >= len(self.content) or length <= 0:
+        size = len(self)
+        if position < 0 or position >= size or length <= 0:
             return ""
         
-        end_pos = min(position + length, len(self.content))
-        deleted_text = self.content[position:end_pos]
-        self.content = self.content[:position] + self.content[end_pos:]
+        count = min(length, size - position)
+        self._move_gap(position)
+        right = self._right
+        deleted_text = "".join(reversed(right[-count:]))
+        del right[-count:]
+        self._content = None
         self.cursor_position = position
-        self.history.append(f"Deleted '{deleted_text}' from position {position}")
+        if self._track_history:
+            self.history.append((_DOC_DELETE, deleted_text, position))
         return deleted_text
     
     def replace_text(self, old_text: str, new_text: str) -> bool:
@@ -64,9 +147,47 @@ class Document:
             return False
         
         self.content = self.content.replace(old_text, new_text)
-        self.history.append(f"Replaced '{old_text}' with '{new_text}'")
+        if self._track_history:
+            self.history.append((_DOC_REPLACE, old_text, new_text))
         return True
     
+    def revert_replace(self, positions: List[int], old_text: str, new_text: str) -> bool:
+        """Undo a replace_text call given the original match positions
+        
+        Only the recorded spans are restored, so occurrences of new_text that
+        were already in the document are left alone.
+        """
+        content = self.content
+        shift = len(new_text) - len(old_text)
+        parts = []
+        prev = 0
+        for i, pos in enumerate(positions):
+            start = pos + i * shift  # where the replacement landed
+            if content[start:start + len(new_text)] != new_text:
+                return False
+            parts.append(content[prev:start])
+            parts.append(old_text)
+            prev = start + len(new_text)
+        parts.append(content[prev:])
+        
+        self.content = "".join(parts)
+        if self._track_history:
+            self.history.append((_DOC_REPLACE, new_text, old_text))
+        return True
+    
+    def enable_history(self):
+        """Start recording edits in the history log"""
+        self._track_history = True
+    
+    def disable_history(self):
+        """Stop recording edits (entries already logged are kept)"""
+        self._track_history = False
+    
+    def get_history(self) -> List[str]:
+        """Get the edit log (entries are formatted on demand)"""
+        return [_DOC_HISTORY_FORMATS[op].format(first, second)
+                for op, first, second in self.history]
+    
     def get_content(self) -> str:
         return self.content
     
@@ -74,16 +195,19 @@ class Document:
         return self.cursor_position
     
     def set_cursor_position(self, position: int) -> bool:
-        if 0 <= position <= len(self.content):
+        if 0 <= position <= len(self):
             self.cursor_position = position
             return True
         return False
 
 class Calculator:
     """Calculator that can perform operations"""
+    __slots__ = ('value', 'history')
+    MAX_HISTORY = 100
+    
     def __init__(self):
         self.value = 0.0
-        self.history = []
+        self.history: Deque[str] = deque(maxlen=self.MAX_HISTORY)
     
     def add(self, number: float) -> float:
         """Add a number to current value"""
@@ -116,6 +240,36 @@ class Calculator:
         self.history.append(f"Divided {old_value} by {number} = {self.value}")
         return self.value
     
+    def apply_batch(self, ops: Iterable[Tuple[str, float]]) -> float:
+        """Apply (operator, number) pairs in one tight loop
+        
+        Bulk replay skips the per-step method call and history string; a
+        single summary entry is recorded instead. The value is only updated
+        once the whole batch has succeeded.
+        """
+        add, sub, mul, div = '+', '-', '*', '/'
+        value = self.value
+        count = 0
+        for op, number in ops:
+            if op == add:
+                value += number
+            elif op == sub:
+                value -= number
+            elif op == mul:
+                value *= number
+            elif op == div:
+                if number == 0:
+                    raise ValueError("Cannot divide by zero")
+                value /= number
+            else:
+                raise ValueError(f"Unsupported operator: {op}")
+            count += 1
+        
+        old_value = self.value
+        self.value = value
+        self.history.append(f"Applied {count} operations to {old_value} = {value}")
+        return value
+    
     def get_value(self) -> float:
         return self.value
     
@@ -126,40 +280,85 @@ class Calculator:
 # COMMAND INTERFACE AND CONCRETE COMMANDS
 # ============================================================================
 
-class Command(ABC):
-    """Abstract command interface"""
-    @abstractmethod
+class Command(Protocol):
+    """Command interface (structural - checked statically)
+    
+    Concrete commands implement it without inheriting from it: subclassing a
+    Protocol would give them its ABCMeta-derived metaclass again.
+    """
+    __slots__ = ()
+    
     def execute(self) -> bool:
         """Execute the command"""
-        pass
+        ...
     
-    @abstractmethod
     def undo(self) -> bool:
         """Undo the command"""
-        pass
+        ...
     
-    @abstractmethod
     def get_description(self) -> str:
         """Get command description"""
-        pass
+        ...
 
 # ============================================================================
 # DOCUMENT COMMANDS
 # ============================================================================
 
-class InsertTextCommand(Command):
+class _Pool:
+    """Free list of spare instances of one command class"""
+    __slots__ = ('free', 'cap')
+    
+    def __init__(self, cap: int = 256):
+        self.free: List[Command] = []
+        self.cap = cap
+
+class InsertTextCommand:
     """Command to insert text into document"""
+    __slots__ = ('document', 'text', 'position', 'executed', '_tlen', '_pooled', '_refs')
+    
     def __init__(self, document: Document, text: str, position: int):
         self.document = document
         self.text = text
         self.position = position
         self.executed = False
+        self._tlen = len(text)  # reused by every execute/undo
+        self._pooled = False
+        self._refs = 0  # slots in a CommandManager's stacks/history holding it
+    
+    @classmethod
+    def acquire(cls, document: Document, text: str, position: int) -> 'InsertTextCommand':
+        """Get a command from the pool (or a new one) for high-volume replay
+        
+        Pooled commands belong to the CommandManager that runs them: it
+        counts the stack and history entries holding each one and releases
+        it back to the pool when the last goes, so callers must not keep
+        references to them.
+        """
+        free = cls._pool.free
+        if free:
+            command = free.pop()
+            command.__init__(document, text, position)
+        else:
+            command = cls(document, text, position)
+        command._pooled = True
+        return command
+    
+    def release(self):
+        """Return an acquired command to the pool (no-op for regular ones)"""
+        if not self._pooled:
+            return
+        self._pooled = False
+        self.document = None
+        self.text = ""
+        free = self._pool.free
+        if len(free) < self._pool.cap:
+            free.append(self)
     
     def execute(self) -> bool:
         if self.executed:
             return False
         
-        success = self.document.insert_text(self.text, self.position)
+        success = self.document._insert_text_fast(self.text, self.position, self._tlen)
         if success:
             self.executed = True
         return success
@@ -169,7 +368,7 @@ class InsertTextCommand(Command):
             return False
         
         # Delete the text we inserted
-        deleted = self.document.delete_text(self.position, len(self.text))
+        deleted = self.document.delete_text(self.position, self._tlen)
         if deleted == self.text:
             self.executed = False
             return True
@@ -178,27 +377,42 @@ class InsertTextCommand(Command):
     def get_description(self) -> str:
         return f"Insert '{self.text}' at position {self.position}"
 
-class DeleteTextCommand(Command):
+InsertTextCommand._pool = _Pool()
+
+class DeleteTextCommand:
     """Command to delete text from document"""
+    __slots__ = ('document', 'position', 'length', '_deleted', 'executed')
+    
     def __init__(self, document: Document, position: int, length: int):
         self.document = document
         self.position = position
         self.length = length
-        self.deleted_text = ""
+        self._deleted: Union[str, bytes] = ""  # large deletions are stored compressed
         self.executed = False
     
+    @property
+    def deleted_text(self) -> str:
+        deleted = self._deleted
+        if isinstance(deleted, bytes):
+            return zlib.decompress(deleted).decode('utf-8')
+        return deleted
+    
     def execute(self) -> bool:
         if self.executed:
             return False
         
-        self.deleted_text = self.document.delete_text(self.position, self.length)
-        if self.deleted_text:
+        deleted_text = self.document.delete_text(self.position, self.length)
+        if len(deleted_text) >= _COMPRESS_MIN_CHARS:
+            self._deleted = zlib.compress(deleted_text.encode('utf-8'))
+        else:
+            self._deleted = deleted_text
+        if deleted_text:
             self.executed = True
             return True
         return False
     
     def undo(self) -> bool:
-        if not self.executed or not self.deleted_text:
+        if not self.executed or not self._deleted:
             return False
         
         # Re-insert the deleted text
@@ -210,18 +424,24 @@ class DeleteTextCommand(Command):
     def get_description(self) -> str:
         return f"Delete {self.length} characters from position {self.position}"
 
-class ReplaceTextCommand(Command):
+class ReplaceTextCommand:
     """Command to replace text in document"""
+    __slots__ = ('document', 'old_text', 'new_text', 'executed', '_pattern', '_match_positions')
+    
     def __init__(self, document: Document, old_text: str, new_text: str):
         self.document = document
         self.old_text = old_text
         self.new_text = new_text
         self.executed = False
+        self._pattern = re.compile(re.escape(old_text))
+        self._match_positions: List[int] = []
     
     def execute(self) -> bool:
         if self.executed:
             return False
         
+        # Remember where each match was so undo can splice without rescanning
+        self._match_positions = [m.start() for m in self._pattern.finditer(self.document.content)]
         success = self.document.replace_text(self.old_text, self.new_text)
         if success:
             self.executed = True
@@ -231,8 +451,8 @@ class ReplaceTextCommand(Command):
         if not self.executed:
             return False
         
-        # Replace back to original text
-        success = self.document.replace_text(self.new_text, self.old_text)
+        # Put the original text back at the recorded positions only
+        success = self.document.revert_replace(self._match_positions, self.old_text, self.new_text)
         if success:
             self.executed = False
         return success
@@ -244,22 +464,53 @@ class ReplaceTextCommand(Command):
 # CALCULATOR COMMANDS
 # ============================================================================
 
-class CalculatorCommand(Command):
-    """Base class for calculator commands"""
-    def __init__(self, calculator: Calculator, number: float):
+# Operator code -> (receiver operation, description label)
+_CALC_OPS = {
+    '+': (Calculator.add, "Add"),
+    '-': (Calculator.subtract, "Subtract"),
+    '*': (Calculator.multiply, "Multiply by"),
+    '/': (Calculator.divide, "Divide by"),
+}
+
+# Inverse of each operator, used to undo without remembering the old value
+_CALC_INVERSE = {
+    '+': operator.sub,
+    '-': operator.add,
+    '*': operator.truediv,
+    '/': operator.mul,
+}
+
+class CalculatorCommand:
+    """Calculator command driven by an operator code
+    
+    One execute/undo implementation serves every operation; the operator is
+    looked up in _CALC_OPS instead of being a separate method override.
+    """
+    __slots__ = ('calculator', 'number', 'op', 'previous_value', 'executed')
+    OP = '+'
+    
+    def __init__(self, calculator: Calculator, number: float, op: Optional[str] = None):
         self.calculator = calculator
         self.number = number
-        self.previous_value = 0.0
+        self.op = op or self.OP
+        if self.op not in _CALC_OPS:
+            raise ValueError(f"Unsupported operator: {self.op}")
+        # Old value, only kept when applying the inverse would not restore it
+        # exactly (float rounding, multiply by zero); None otherwise
+        self.previous_value: Optional[float] = None
         self.executed = False
-
-class AddCommand(CalculatorCommand):
-    """Command to add a number"""
+    
     def execute(self) -> bool:
         if self.executed:
             return False
         
-        self.previous_value = self.calculator.get_value()
-        self.calculator.add(self.number)
+        calculator = self.calculator
+        previous = calculator.value
+        _CALC_OPS[self.op][0](calculator, self.number)
+        if self.number != 0 and _CALC_INVERSE[self.op](calculator.value, self.number) == previous:
+            self.previous_value = None
+        else:
+            self.previous_value = previous
         self.executed = True
         return True
     
@@ -267,98 +518,174 @@ class AddCommand(CalculatorCommand):
         if not self.executed:
             return False
         
-        self.calculator.set_value(self.previous_value)
+        if self.previous_value is None:
+            self.calculator.value = _CALC_INVERSE[self.op](self.calculator.value, self.number)
+        else:
+            self.calculator.value = self.previous_value
         self.executed = False
         return True
     
     def get_description(self) -> str:
-        return f"Add {self.number}"
+        return f"{_CALC_OPS[self.op][1]} {self.number}"
+
+class AddCommand(CalculatorCommand):
+    """Command to add a number"""
+    __slots__ = ()
+    OP = '+'
 
 class SubtractCommand(CalculatorCommand):
     """Command to subtract a number"""
-    def execute(self) -> bool:
-        if self.executed:
-            return False
-        
-        self.previous_value = self.calculator.get_value()
-        self.calculator.subtract(self.number)
-        self.executed = True
-        return True
-    
-    def undo(self) -> bool:
-        if not self.executed:
-            return False
-        
-        self.calculator.set_value(self.previous_value)
-        self.executed = False
-        return True
-    
-    def get_description(self) -> str:
-        return f"Subtract {self.number}"
+    __slots__ = ()
+    OP = '-'
 
 class MultiplyCommand(CalculatorCommand):
     """Command to multiply by a number"""
-    def execute(self) -> bool:
-        if self.executed:
-            return False
-        
-        self.previous_value = self.calculator.get_value()
-        self.calculator.multiply(self.number)
-        self.executed = True
-        return True
-    
-    def undo(self) -> bool:
-        if not self.executed:
-            return False
-        
-        self.calculator.set_value(self.previous_value)
-        self.executed = False
-        return True
-    
-    def get_description(self) -> str:
-        return f"Multiply by {self.number}"
+    __slots__ = ()
+    OP = '*'
 
 # ============================================================================
 # MACRO COMMAND (Command sequences)
 # ============================================================================
 
-class MacroCommand(Command):
-    """Command that executes multiple commands as a group"""
-    def __init__(self, commands: List[Command], description: str = "Macro Command"):
+def _command_target(command: Command) -> Optional[object]:
+    """The receiver a command edits, or None when it cannot be told"""
+    # Compare with None: receivers such as an empty Document are falsy
+    target = getattr(command, 'document', None)
+    if target is None:
+        target = getattr(command, 'calculator', None)
+    return target
+
+class MacroCommand:
+    """Command that executes multiple commands as a group
+    
+    With ``parallel=True``, commands on different receivers run on a thread
+    pool (one serial lane per receiver); undo still runs in reverse order.
+    """
+    __slots__ = ('_commands', 'description', 'executed', 'parallel', '_executors', '_undoers',
+                 '_last_executed_count')
+    
+    def __init__(self, commands: Iterable[Command], description: str = "Macro Command",
+                 parallel: bool = False):
         self.commands = commands
         self.description = description
         self.executed = False
+        self.parallel = parallel
+        # Commands that succeeded on the last execute() run, before any rollback
+        self._last_executed_count = 0
+    
+    @property
+    def commands(self) -> Tuple[Command, ...]:
+        """The macro's commands (a tuple; assign a new sequence to change them)"""
+        return self._commands
+    
+    @commands.setter
+    def commands(self, commands: Iterable[Command]):
+        self._commands = tuple(commands)
+        # Bound methods resolved once, so playback does no per-step attribute lookup
+        self._executors = tuple(c.execute for c in self._commands)
+        self._undoers = tuple(c.undo for c in self._commands)
     
     def execute(self) -> bool:
         if self.executed:
             return False
         
-        print(f"🎬 Executing macro: {self.description}")
-        for i, command in enumerate(self.commands):
-            if not command.execute():
+        logger.debug("🎬 Executing macro: %s", self.description)
+        if self.parallel:
+            lanes = self._lanes()
+            if lanes is not None:
+                return self._execute_lanes(lanes)
+        
+        for i, execute in enumerate(self._executors):
+            try:
+                ok = execute()
+            except BaseException:
+                # Same all-or-nothing rollback as a failure, then re-raise
+                self._rollback(i)
+                raise
+            if not ok:
                 # If any command fails, undo all previously executed commands
-                print(f"❌ Command {i+1} failed, undoing previous commands...")
-                for j in range(i-1, -1, -1):
-                    self.commands[j].undo()
+                logger.debug("❌ Command %d failed, undoing previous commands...", i + 1)
+                self._rollback(i)
                 return False
         
+        self._last_executed_count = len(self._executors)
         self.executed = True
-        print(f"✅ Macro completed successfully")
+        logger.debug("✅ Macro completed successfully")
         return True
     
+    def _rollback(self, count: int):
+        """Undo the first count commands, newest first, after a failed run"""
+        self._last_executed_count = count
+        for undo in reversed(self._undoers[:count]):
+            undo()
+    
     def undo(self) -> bool:
         if not self.executed:
             return False
         
-        print(f"🔄 Undoing macro: {self.description}")
+        logger.debug("🔄 Undoing macro: %s", self.description)
         # Undo commands in reverse order
-        for command in reversed(self.commands):
-            command.undo()
+        for undo in reversed(self._undoers):
+            undo()
         
         self.executed = False
-        print(f"✅ Macro undone successfully")
+        logger.debug("✅ Macro undone successfully")
         return True
     
+    def _lanes(self) -> Optional[List[List[int]]]:
+        """Command indices grouped per receiver, or None if not worth a pool
+        
+        Commands with an unknown receiver (e.g. nested macros) could touch
+        anything, so their presence keeps the whole macro serial.
+        """
+        lanes: Dict[int, List[int]] = {}
+        for i, command in enumerate(self.commands):
+            target = _command_target(command)
+            if target is None:
+                return None
+            lanes.setdefault(id(target), []).append(i)
+        return list(lanes.values()) if len(lanes) > 1 else None
+    
+    def _execute_lanes(self, lanes: List[List[int]]) -> bool:
+        """Run each lane serially, lanes concurrently; roll back all on failure
+        
+        All or nothing: if any command fails or raises, every command that
+        succeeded in any lane is undone before returning False (or
+        re-raising the first exception).
+        """
+        executors = self._executors
+        
+        def run(lane: List[int]) -> Tuple[int, bool, Optional[BaseException]]:
+            done = 0
+            try:
+                for i in lane:
+                    if not executors[i]():
+                        return done, False, None
+                    done += 1
+            except BaseException as e:
+                return done, False, e
+            return done, True, None
+        
+        with ThreadPoolExecutor(max_workers=min(len(lanes), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(run, lanes))
+        
+        self._last_executed_count = sum(done for done, _, _ in results)
+        if all(ok for _, ok, _ in results):
+            self.executed = True
+            logger.debug("✅ Macro completed successfully")
+            return True
+        
+        logger.debug("❌ A command failed, undoing previous commands...")
+        undoers = self._undoers
+        for lane, (done, _, _) in zip(lanes, results):
+            for i in reversed(lane[:done]):
+                undoers[i]()
+        
+        error = next((e for _, _, e in results if e is not None), None)
+        if error is not None:
+            raise error
+        return False
+    
     def get_description(self) -> str:
         return f"{self.description} ({len(self.commands)} commands)"
 
@@ -366,65 +693,107 @@ class MacroCommand(Command):
 # COMMAND MANAGER (Invoker)
 # ============================================================================
 
+def _push(stack: Deque[Command], command: Command) -> Optional[Command]:
+    """Append to a bounded deque, returning the entry it evicted (if any)"""
+    evicted = None
+    if len(stack) == stack.maxlen:
+        # A deque with maxlen 0 drops the new entry itself
+        evicted = stack[0] if stack else command
+    stack.append(command)
+    return evicted
+
+def _push_history(history: Deque[Tuple[Command, int, int]],
+                  entry: Tuple[Command, int, int]) -> Optional[Command]:
+    """Append a history entry, returning the command of the one it evicted"""
+    evicted = None
+    if len(history) == history.maxlen:
+        evicted = history[0][0] if history else entry[0]
+    history.append(entry)
+    return evicted
+
+def _retain(command: Command, count: int = 1):
+    """Count new manager references to a pooled command"""
+    if getattr(command, '_pooled', False):
+        command._refs += count
+
+def _release_ref(command: Optional[Command]):
+    """Drop one manager reference; a pooled command goes back on the last"""
+    if getattr(command, '_pooled', False):
+        command._refs -= 1
+        if not command._refs:
+            command.release()
+
 class CommandManager:
     """Manages command execution, undo/redo, and history"""
-    def __init__(self):
-        self.undo_stack: List[Command] = []
-        self.redo_stack: List[Command] = []
-        self.command_history: List[Dict[str, Any]] = []
-        self.max_history = 100
+    def __init__(self, max_history: int = 100):
+        # All bounded: the oldest entry is dropped in O(1) once max_history is
+        # reached, so long sessions don't pin every command (and its receiver)
+        self.undo_stack: Deque[Command] = deque(maxlen=max_history)
+        self.redo_stack: Deque[Command] = deque(maxlen=max_history)
+        self.command_history: Deque[Tuple[Command, int, int]] = deque(maxlen=max_history)
+    
+    @property
+    def max_history(self) -> int:
+        """History bound, fixed at construction (it sizes the deques)"""
+        return self.undo_stack.maxlen
     
     def execute_command(self, command: Command) -> bool:
         """Execute a command and add it to history"""
-        print(f"▶️  Executing: {command.get_description()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("▶️  Executing: %s", command.get_description())
         
         success = command.execute()
         if success:
-            self.undo_stack.append(command)
-            self.redo_stack.clear()  # Clear redo stack when new command executed
+            _retain(command, 2)  # undo stack + history entry
+            redo_stack = self.redo_stack
+            if redo_stack:
+                for dropped in redo_stack:
+                    _release_ref(dropped)
+                redo_stack.clear()  # Clear redo stack when new command executed
+            _release_ref(_push(self.undo_stack, command))
             
             # Add to history
-            self.command_history.append({
-                'command': command,
-                'description': command.get_description(),
-                'timestamp': datetime.now(),
-                'type': 'execute'
-            })
+            _release_ref(_push_history(self.command_history, (command, _EXECUTE, time.monotonic_ns())))
             
-            # Limit history size
-            if len(self.command_history) > self.max_history:
-                self.command_history.pop(0)
-            
-            print(f"✅ Command executed successfully")
+            logger.debug("✅ Command executed successfully")
         else:
-            print(f"❌ Command execution failed")
+            logger.debug("❌ Command execution failed")
         
         return success
     
+    def execute_atomic(self, commands: Iterable[Command],
+                       description: str = "Macro Command") -> bool:
+        """Execute several commands as one undoable history entry
+        
+        The commands run inside a MacroCommand, so the stacks and history get
+        a single entry instead of one per command, and a failure part way
+        rolls back the ones that already ran.
+        """
+        if not isinstance(commands, MacroCommand):
+            commands = MacroCommand(list(commands), description)
+        return self.execute_command(commands)
+    
     def undo(self) -> bool:
         """Undo the last executed command"""
         if not self.undo_stack:
-            print("⚠️  Nothing to undo")
+            logger.debug("⚠️  Nothing to undo")
             return False
         
         command = self.undo_stack.pop()
-        print(f"↩️  Undoing: {command.get_description()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("↩️  Undoing: %s", command.get_description())
         
         success = command.undo()
         if success:
-            self.redo_stack.append(command)
+            _retain(command)  # history entry; the stack slot moves to redo
+            _release_ref(_push(self.redo_stack, command))
             
             # Add to history
-            self.command_history.append({
-                'command': command,
-                'description': f"UNDO: {command.get_description()}",
-                'timestamp': datetime.now(),
-                'type': 'undo'
-            })
+            _release_ref(_push_history(self.command_history, (command, _UNDO, time.monotonic_ns())))
             
-            print(f"✅ Command undone successfully")
+            logger.debug("✅ Command undone successfully")
         else:
-            print(f"❌ Command undo failed")
+            logger.debug("❌ Command undo failed")
             # Put command back on undo stack if undo failed
             self.undo_stack.append(command)
         
@@ -433,27 +802,24 @@ class CommandManager:
     def redo(self) -> bool:
         """Redo the last undone command"""
         if not self.redo_stack:
-            print("⚠️  Nothing to redo")
+            logger.debug("⚠️  Nothing to redo")
             return False
         
         command = self.redo_stack.pop()
-        print(f"↪️  Redoing: {command.get_description()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("↪️  Redoing: %s", command.get_description())
         
         success = command.execute()
         if success:
-            self.undo_stack.append(command)
+            _retain(command)  # history entry; the stack slot moves to undo
+            _release_ref(_push(self.undo_stack, command))
             
             # Add to history
-            self.command_history.append({
-                'command': command,
-                'description': f"REDO: {command.get_description()}",
-                'timestamp': datetime.now(),
-                'type': 'redo'
-            })
+            _release_ref(_push_history(self.command_history, (command, _REDO, time.monotonic_ns())))
             
-            print(f"✅ Command redone successfully")
+            logger.debug("✅ Command redone successfully")
         else:
-            print(f"❌ Command redo failed")
+            logger.debug("❌ Command redo failed")
             # Put command back on redo stack if redo failed
             self.redo_stack.append(command)
         
@@ -467,35 +833,73 @@ class CommandManager:
         """Check if redo is possible"""
         return len(self.redo_stack) > 0
     
-    def get_history(self) -> List[Dict[str, Any]]:
-        """Get command history"""
-        return self.command_history.copy()
+    def get_history(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get command history, optionally only the ``last`` entries
+        
+        Entries are formatted on demand, so asking for a tail only formats
+        (and walks) that many entries.
+        """
+        entries: Iterable[Tuple[Command, int, int]] = self.command_history
+        if last is not None:
+            entries = reversed(list(islice(reversed(self.command_history), last)))
+        return [
+            {
+                'command': command,
+                'description': _HISTORY_PREFIXES[type_code] + command.get_description(),
+                'timestamp': datetime.fromtimestamp((_WALL_CLOCK_OFFSET_NS + ns) / 1e9),
+                'type': _HISTORY_TYPES[type_code]
+            }
+            for command, type_code, ns in entries
+        ]
     
     def clear_history(self):
         """Clear all history"""
+        for command in self.undo_stack:
+            _release_ref(command)
+        for command in self.redo_stack:
+            _release_ref(command)
+        for entry in self.command_history:
+            _release_ref(entry[0])
         self.undo_stack.clear()
         self.redo_stack.clear()
         self.command_history.clear()
-        print("🗑️  Command history cleared")
+        logger.debug("🗑️  Command history cleared")
     
     def print_status(self):
-        """Print current status"""
-        print(f"\n📊 Command Manager Status:")
-        print(f"   Undo stack: {len(self.undo_stack)} commands")
-        print(f"   Redo stack: {len(self.redo_stack)} commands")
-        print(f"   History: {len(self.command_history)} entries")
-        print(f"   Can undo: {self.can_undo()}")
-        print(f"   Can redo: {self.can_redo()}")
+        """Log current status at debug level"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            "\n📊 Command Manager Status:\n"
+            "   Undo stack: %d commands\n"
+            "   Redo stack: %d commands\n"
+            "   History: %d entries\n"
+            "   Can undo: %s\n"
+            "   Can redo: %s",
+            len(self.undo_stack), len(self.redo_stack), len(self.command_history),
+            self.can_undo(), self.can_redo(),
+        )
 
 # ============================================================================
 # DEMO FUNCTIONS
 # ============================================================================
 
+def _enable_demo_logging():
+    """Show the command diagnostics on stdout (idempotent)"""
+    if not any(getattr(h, '_command_demo', False) for h in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._command_demo = True
+        logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
 def demo_command_interview():
     """
     🎯 INTERVIEW DEMO: Command Pattern
     Demonstrates undo/redo, macro commands, and command queuing
     """
+    _enable_demo_logging()
+    
     print("\n" + "="*60)
     print("🚀 COMMAND PATTERN - INTERVIEW DEMO")
     print("="*60)
@@ -629,8 +1033,7 @@ def demo_command_interview():
     
     # Show command history
     print("\n📋 Command history:")
-    history = manager.get_history()
-    for i, entry in enumerate(history[-10:], 1):  # Show last 10 commands
+    for i, entry in enumerate(manager.get_history(last=10), 1):  # Show last 10 commands
         timestamp = entry['timestamp'].strftime("%H:%M:%S")
         print(f"   {i}. [{timestamp}] {entry['description']}")
     
@@ -669,6 +1072,12 @@ def demo_command_interview():
     invalid_doc.insert_text("Hello", 0)
     invalid_delete = DeleteTextCommand(invalid_doc, 10, 5)  # Beyond content length
     error_manager.execute_command(invalid_delete)
+    
+    # A manager that keeps no history still executes, it just can't undo
+    print("\nTesting a manager with max_history=0:")
+    no_history = CommandManager(max_history=0)
+    print(f"Executed: {no_history.execute_command(InsertTextCommand(Document(), 'hi', 0))}, "
+          f"can undo: {no_history.undo()}")
 
 if __name__ == "__main__":
     demo_command_interview()
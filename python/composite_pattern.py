@@ -19,9 +19,17 @@ compositions uniformly.
 '''
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+from collections import deque
 from datetime import datetime
 import os
+import time
+
+# Indentation prefixes for tree displays, built once instead of per node
+_INDENTS = tuple("  " * i for i in range(64))
+
+def _indent(level: int) -> str:
+    return _INDENTS[level] if level < 64 else "  " * level
 
 # ============================================================================
 # FILE SYSTEM COMPOSITE
@@ -29,12 +37,40 @@ import os
 
 class FileSystemComponent(ABC):
     """Abstract base class for file system components"""
+    __slots__ = ('_name', 'parent', 'created_ns', 'modified_ns')
+    _is_container = False  # True for components that hold children
     
     def __init__(self, name: str):
-        self.name = name
+        self._name = name
         self.parent: Optional['FileSystemComponent'] = None
-        self.created_at = datetime.now()
-        self.modified_at = datetime.now()
+        # Raw time.time_ns() stamps; datetimes are only built when read
+        self.created_ns = self.modified_ns = time.time_ns()
+    
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @name.setter
+    def name(self, value: str):
+        parent = self.parent
+        if parent is not None and value != self._name:
+            # The parent keys its children by name: re-key in place (keeping
+            # the listing order) and drop the name indexes above
+            if value in parent.children:
+                raise ValueError(f"{parent.name} already contains {value!r}")
+            old = self._name
+            parent.children = {value if key == old else key: child
+                               for key, child in parent.children.items()}
+            parent._invalidate()
+        self._name = value
+    
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_ns / 1e9)
+    
+    @property
+    def modified_at(self) -> datetime:
+        return datetime.fromtimestamp(self.modified_ns / 1e9)
     
     @abstractmethod
     def get_size(self) -> int:
@@ -51,35 +87,72 @@ class FileSystemComponent(ABC):
         """Display component with indentation"""
         pass
     
+    def iter_display(self, indent: int = 0) -> Iterator[str]:
+        """Yield the display lines one at a time (streams large trees)"""
+        yield self.display(indent)
+    
     def get_path(self) -> str:
         """Get full path of component"""
-        if self.parent:
-            return os.path.join(self.parent.get_path(), self.name)
-        return self.name
+        names = []
+        node = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return os.path.join(*reversed(names))
     
     def get_depth(self) -> int:
         """Get depth in hierarchy"""
-        if self.parent:
-            return self.parent.get_depth() + 1
-        return 0
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
+    
+    def _invalidate_ancestors(self):
+        """Drop cached aggregates of every directory above this component"""
+        # An ancestor is only cached if its subtree was, so the walk can stop
+        # at the first directory with nothing cached
+        node = self.parent
+        while node is not None and (node._size_cache is not None
+                                    or node._file_count_cache is not None
+                                    or node._directory_count_cache is not None):
+            node._size_cache = node._file_count_cache = node._directory_count_cache = None
+            node = node.parent
 
 class File(FileSystemComponent):
     """Leaf class representing a file"""
+    __slots__ = ('_size', 'content', 'extension')
     
     def __init__(self, name: str, size: int, content: str = ""):
         super().__init__(name)
-        self.size = size
+        self._size = size
         self.content = content
         self.extension = os.path.splitext(name)[1]
     
+    @property
+    def size(self) -> int:
+        return self._size
+    
+    @size.setter
+    def size(self, value: int):
+        self._size = value
+        self._invalidate_ancestors()
+    
     def get_size(self) -> int:
-        return self.size
+        return self._size
     
     def get_type(self) -> str:
         return "file"
     
+    def get_file_count(self) -> int:
+        return 1
+    
+    def get_directory_count(self) -> int:
+        return 0
+    
     def display(self, indent: int = 0) -> str:
-        prefix = "  " * indent
+        prefix = _indent(indent)
         return f"{prefix}📄 {self.name} ({self.size} bytes)"
     
     def read_content(self) -> str:
@@ -89,91 +162,135 @@ class File(FileSystemComponent):
     def write_content(self, content: str):
         """Write content to file"""
         self.content = content
-        self.size = len(content.encode('utf-8'))
-        self.modified_at = datetime.now()
+        # ASCII text is one byte per character - no need to encode to count
+        self.size = len(content) if content.isascii() else len(content.encode('utf-8'))
+        self.modified_ns = time.time_ns()
         print(f"✏️ Updated file: {self.name}")
 
 class Directory(FileSystemComponent):
     """Composite class representing a directory"""
+    __slots__ = ('children', '_size_cache', '_file_count_cache', '_directory_count_cache',
+                 '_name_index')
+    _is_container = True
     
     def __init__(self, name: str):
         super().__init__(name)
-        self.children: List[FileSystemComponent] = []
+        # Keyed by name (insertion ordered): names are unique within a directory
+        self.children: Dict[str, FileSystemComponent] = {}
+        # Subtree aggregates, computed on first use and reset (up to the root)
+        # whenever something below changes
+        self._size_cache: Optional[int] = None
+        self._file_count_cache: Optional[int] = None
+        self._directory_count_cache: Optional[int] = None
+        # name -> nearest matching component in the subtree, built by find()
+        self._name_index: Optional[Dict[str, FileSystemComponent]] = None
+    
+    def _invalidate(self):
+        """Drop this directory's cached aggregates and those above it"""
+        self._size_cache = self._file_count_cache = self._directory_count_cache = None
+        self._invalidate_ancestors()
+        # Any ancestor may hold a name index, even when this directory has none
+        node = self
+        while node is not None:
+            node._name_index = None
+            node = node.parent
     
     def get_size(self) -> int:
         """Calculate total size of directory and all children"""
-        total_size = 0
-        for child in self.children:
-            total_size += child.get_size()
-        return total_size
+        if self._size_cache is None:
+            total_size = 0
+            for child in self.children.values():
+                total_size += child.get_size()
+            self._size_cache = total_size
+        return self._size_cache
     
     def get_type(self) -> str:
         return "directory"
     
     def display(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}📁 {self.name}/ ({len(self.children)} items, {self.get_size()} bytes)\n"
-        
-        for child in self.children:
-            result += child.display(indent + 1) + "\n"
-        
-        return result.rstrip()
+        return "\n".join(self.iter_display(indent))
+    
+    def iter_display(self, indent: int = 0) -> Iterator[str]:
+        prefix = _indent(indent)
+        yield f"{prefix}📁 {self.name}/ ({len(self.children)} items, {self.get_size()} bytes)"
+        for child in self.children.values():
+            yield from child.iter_display(indent + 1)
     
     def add(self, component: FileSystemComponent) -> bool:
         """Add child component"""
-        if component not in self.children:
+        if component.name not in self.children:
             component.parent = self
-            self.children.append(component)
-            self.modified_at = datetime.now()
+            self.children[component.name] = component
+            self._invalidate()
+            self.modified_ns = time.time_ns()
             print(f"➕ Added {component.get_type()}: {component.name}")
             return True
         return False
     
     def remove(self, component: FileSystemComponent) -> bool:
         """Remove child component"""
-        if component in self.children:
+        if self.children.get(component.name) is component:
             component.parent = None
-            self.children.remove(component)
-            self.modified_at = datetime.now()
+            del self.children[component.name]
+            self._invalidate()
+            self.modified_ns = time.time_ns()
             print(f"➖ Removed {component.get_type()}: {component.name}")
             return True
         return False
     
     def find(self, name: str) -> Optional[FileSystemComponent]:
-        """Find component by name (recursive search)"""
-        for child in self.children:
-            if child.name == name:
-                return child
-            if isinstance(child, Directory):
-                found = child.find(name)
-                if found:
-                    return found
-        return None
+        """Find component by name (breadth-first, nearest match wins)"""
+        if self._name_index is None:
+            # One breadth-first pass indexes every name; repeated lookups are
+            # then dict hits until the tree below changes
+            index: Dict[str, FileSystemComponent] = {}
+            pending = deque([self])
+            while pending:
+                directory = pending.popleft()
+                for child in directory.children.values():
+                    index.setdefault(child.name, child)
+                    if child._is_container:
+                        pending.append(child)
+            self._name_index = index
+        return self._name_index.get(name)
     
     def get_file_count(self) -> int:
         """Get total number of files in directory tree"""
-        count = 0
-        for child in self.children:
-            if isinstance(child, File):
-                count += 1
-            elif isinstance(child, Directory):
+        if self._file_count_cache is None:
+            count = 0
+            for child in self.children.values():
                 count += child.get_file_count()
-        return count
+            self._file_count_cache = count
+        return self._file_count_cache
     
     def get_directory_count(self) -> int:
         """Get total number of directories in directory tree"""
-        count = 1  # Count self
-        for child in self.children:
-            if isinstance(child, Directory):
+        if self._directory_count_cache is None:
+            count = 1  # Count self
+            for child in self.children.values():
                 count += child.get_directory_count()
-        return count
+            self._directory_count_cache = count
+        return self._directory_count_cache
 
 # ============================================================================
 # UI COMPONENT COMPOSITE
 # ============================================================================
 
+# Absolute (x, y, width, height) clip rectangle
+Rect = Tuple[int, int, int, int]
+
+def _clip_rect(clip: Rect, x: int, y: int, width: int, height: int) -> Optional[Rect]:
+    """Part of the rectangle that lies inside ``clip``, or None if it is all outside"""
+    left, top = max(clip[0], x), max(clip[1], y)
+    right = min(clip[0] + clip[2], x + width)
+    bottom = min(clip[1] + clip[3], y + height)
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right - left, bottom - top)
+
 class UIComponent(ABC):
     """Abstract base class for UI components"""
+    __slots__ = ('name', 'x', 'y', 'width', 'height', 'visible', 'parent', 'children')
     
     def __init__(self, name: str, x: int = 0, y: int = 0, width: int = 100, height: int = 50):
         self.name = name
@@ -186,8 +303,14 @@ class UIComponent(ABC):
         self.children: List['UIComponent'] = []
     
     @abstractmethod
-    def render(self) -> str:
-        """Render component"""
+    def render(self, parent_origin: Optional[Tuple[int, int]] = None,
+               clip: Optional[Rect] = None) -> str:
+        """Render component
+        
+        ``parent_origin`` is the parent's absolute position when rendering
+        from a parent; without it the position is resolved via the parents.
+        Components entirely outside ``clip`` (absolute) render as "".
+        """
         pass
     
     @abstractmethod
@@ -215,6 +338,16 @@ class UIComponent(ABC):
             return (parent_x + self.x, parent_y + self.y)
         return (self.x, self.y)
     
+    def _absolute_position(self, parent_origin: Optional[Tuple[int, int]]) -> tuple:
+        """Absolute position, reusing the parent's origin when it is known"""
+        if parent_origin is None:
+            return self.get_absolute_position()
+        return (parent_origin[0] + self.x, parent_origin[1] + self.y)
+    
+    def get_total_components(self) -> int:
+        """Get number of components in this subtree (a leaf counts itself)"""
+        return 1
+    
     def is_point_inside(self, x: int, y: int) -> bool:
         """Check if point is inside component bounds"""
         abs_x, abs_y = self.get_absolute_position()
@@ -223,17 +356,21 @@ class UIComponent(ABC):
 
 class Button(UIComponent):
     """Leaf component - Button"""
+    __slots__ = ('text', 'enabled')
     
     def __init__(self, name: str, text: str, x: int = 0, y: int = 0, width: int = 100, height: int = 30):
         super().__init__(name, x, y, width, height)
         self.text = text
         self.enabled = True
     
-    def render(self) -> str:
+    def render(self, parent_origin: Optional[Tuple[int, int]] = None,
+               clip: Optional[Rect] = None) -> str:
         if not self.visible:
             return ""
         
-        abs_x, abs_y = self.get_absolute_position()
+        abs_x, abs_y = self._absolute_position(parent_origin)
+        if clip is not None and _clip_rect(clip, abs_x, abs_y, self.width, self.height) is None:
+            return ""
         status = "enabled" if self.enabled else "disabled"
         return f"🔘 Button '{self.text}' at ({abs_x}, {abs_y}) [{self.width}x{self.height}] - {status}"
     
@@ -247,6 +384,7 @@ class Button(UIComponent):
 
 class Label(UIComponent):
     """Leaf component - Label"""
+    __slots__ = ('text', 'font_size', 'color')
     
     def __init__(self, name: str, text: str, x: int = 0, y: int = 0, width: int = 100, height: int = 20):
         super().__init__(name, x, y, width, height)
@@ -254,11 +392,14 @@ class Label(UIComponent):
         self.font_size = 12
         self.color = "black"
     
-    def render(self) -> str:
+    def render(self, parent_origin: Optional[Tuple[int, int]] = None,
+               clip: Optional[Rect] = None) -> str:
         if not self.visible:
             return ""
         
-        abs_x, abs_y = self.get_absolute_position()
+        abs_x, abs_y = self._absolute_position(parent_origin)
+        if clip is not None and _clip_rect(clip, abs_x, abs_y, self.width, self.height) is None:
+            return ""
         return f"🏷️ Label '{self.text}' at ({abs_x}, {abs_y}) [{self.width}x{self.height}] - {self.color}"
     
     def get_component_type(self) -> str:
@@ -266,25 +407,34 @@ class Label(UIComponent):
 
 class Panel(UIComponent):
     """Composite component - Panel"""
+    __slots__ = ('background_color', 'border_width')
     
     def __init__(self, name: str, x: int = 0, y: int = 0, width: int = 200, height: int = 150):
         super().__init__(name, x, y, width, height)
         self.background_color = "white"
         self.border_width = 1
     
-    def render(self) -> str:
+    def render(self, parent_origin: Optional[Tuple[int, int]] = None,
+               clip: Optional[Rect] = None) -> str:
         if not self.visible:
             return ""
         
-        abs_x, abs_y = self.get_absolute_position()
-        result = f"📦 Panel '{self.name}' at ({abs_x}, {abs_y}) [{self.width}x{self.height}] - {self.background_color}\n"
+        abs_x, abs_y = self._absolute_position(parent_origin)
+        if clip is not None:
+            # Children are culled against the visible part of this panel
+            clip = _clip_rect(clip, abs_x, abs_y, self.width, self.height)
+            if clip is None:
+                return ""
+        parts = [f"📦 Panel '{self.name}' at ({abs_x}, {abs_y}) [{self.width}x{self.height}] - {self.background_color}"]
         
+        # Children get this panel's origin, so nobody walks back up the tree
+        origin = (abs_x, abs_y)
         for child in self.children:
-            child_render = child.render()
+            child_render = child.render(origin, clip)
             if child_render:
-                result += "  " + child_render + "\n"
+                parts.append("  " + child_render)
         
-        return result.rstrip()
+        return "\n".join(parts)
     
     def get_component_type(self) -> str:
         return "panel"
@@ -293,10 +443,7 @@ class Panel(UIComponent):
         """Get total number of components in panel tree"""
         count = 1  # Count self
         for child in self.children:
-            if isinstance(child, Panel):
-                count += child.get_total_components()
-            else:
-                count += 1
+            count += child.get_total_components()
         return count
 
 # ============================================================================
@@ -305,13 +452,37 @@ class Panel(UIComponent):
 
 class Employee(ABC):
     """Abstract base class for employees"""
+    __slots__ = ('name', 'position', '_salary', 'department', 'hire_ns', '_manager')
     
     def __init__(self, name: str, position: str, salary: float):
         self.name = name
         self.position = position
-        self.salary = salary
+        self._salary = salary
         self.department = ""
-        self.hire_date = datetime.now()
+        self.hire_ns = time.time_ns()  # hire_date is built from this on demand
+        self._manager: Optional['Manager'] = None
+    
+    @property
+    def salary(self) -> float:
+        return self._salary
+    
+    @salary.setter
+    def salary(self, value: float):
+        delta = value - self._salary
+        self._salary = value
+        self._adjust_totals(delta, 0)
+    
+    def _adjust_totals(self, salary_delta: float, count_delta: int):
+        """Apply a change in this subtree to the running totals of all managers above"""
+        node = self._manager
+        while node is not None:
+            node._subtree_salary += salary_delta
+            node._subtree_count += count_delta
+            node = node._manager
+    
+    @property
+    def hire_date(self) -> datetime:
+        return datetime.fromtimestamp(self.hire_ns / 1e9)
     
     @abstractmethod
     def get_total_salary(self) -> float:
@@ -331,9 +502,14 @@ class Employee(ABC):
     def get_info(self) -> str:
         """Get employee information"""
         return f"{self.name} - {self.position} (${self.salary:,.2f})"
+    
+    def find_employee(self, name: str) -> Optional['Employee']:
+        """Find employee by name in hierarchy"""
+        return self if self.name == name else None
 
 class IndividualEmployee(Employee):
     """Leaf class - Individual employee"""
+    __slots__ = ()
     
     def get_total_salary(self) -> float:
         return self.salary
@@ -342,51 +518,56 @@ class IndividualEmployee(Employee):
         return 1
     
     def display_hierarchy(self, indent: int = 0) -> str:
-        prefix = "  " * indent
+        prefix = _indent(indent)
         return f"{prefix}👤 {self.get_info()}"
 
 class Manager(Employee):
     """Composite class - Manager with subordinates"""
+    __slots__ = ('subordinates', '_subtree_salary', '_subtree_count')
     
     def __init__(self, name: str, position: str, salary: float):
         super().__init__(name, position, salary)
         self.subordinates: List[Employee] = []
+        # Running totals for the whole team (self included), kept up to date
+        # on every hire, removal and salary change below
+        self._subtree_salary = salary
+        self._subtree_count = 1
+    
+    def _adjust_totals(self, salary_delta: float, count_delta: int):
+        self._subtree_salary += salary_delta
+        self._subtree_count += count_delta
+        super()._adjust_totals(salary_delta, count_delta)
     
     def add_subordinate(self, employee: Employee):
         """Add subordinate"""
         employee.department = self.department
+        employee._manager = self
         self.subordinates.append(employee)
+        self._adjust_totals(employee.get_total_salary(), employee.get_employee_count())
         print(f"➕ {self.name} now manages {employee.name}")
     
     def remove_subordinate(self, employee: Employee):
         """Remove subordinate"""
         if employee in self.subordinates:
             self.subordinates.remove(employee)
+            employee._manager = None
+            self._adjust_totals(-employee.get_total_salary(), -employee.get_employee_count())
             print(f"➖ {self.name} no longer manages {employee.name}")
     
     def get_total_salary(self) -> float:
         """Get total salary including all subordinates"""
-        total = self.salary
-        for subordinate in self.subordinates:
-            total += subordinate.get_total_salary()
-        return total
+        return self._subtree_salary
     
     def get_employee_count(self) -> int:
         """Get total employee count including subordinates"""
-        count = 1  # Count self
-        for subordinate in self.subordinates:
-            count += subordinate.get_employee_count()
-        return count
+        return self._subtree_count
     
     def display_hierarchy(self, indent: int = 0) -> str:
         """Display organizational hierarchy"""
-        prefix = "  " * indent
-        result = f"{prefix}👔 {self.get_info()} (Team: {self.get_employee_count()} people)\n"
-        
-        for subordinate in self.subordinates:
-            result += subordinate.display_hierarchy(indent + 1) + "\n"
-        
-        return result.rstrip()
+        prefix = _indent(indent)
+        parts = [f"{prefix}👔 {self.get_info()} (Team: {self.get_employee_count()} people)"]
+        parts.extend(subordinate.display_hierarchy(indent + 1) for subordinate in self.subordinates)
+        return "\n".join(parts)
     
     def find_employee(self, name: str) -> Optional[Employee]:
         """Find employee by name in hierarchy"""
@@ -394,12 +575,9 @@ class Manager(Employee):
             return self
         
         for subordinate in self.subordinates:
-            if subordinate.name == name:
-                return subordinate
-            if isinstance(subordinate, Manager):
-                found = subordinate.find_employee(name)
-                if found:
-                    return found
+            found = subordinate.find_employee(name)
+            if found:
+                return found
         
         return None
 
@@ -459,7 +637,8 @@ def demo_composite_interview():
     print(f"   Directories: {root.get_directory_count()}")
     
     print(f"\n📁 File System Structure:")
-    print(root.display())
+    for line in root.iter_display():
+        print(line)
     
     # Test search functionality
     print(f"\n🔍 Searching for 'main.py':")
@@ -20,18 +20,32 @@ subclassing for extending functionality.
 '''
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Callable
+from typing import Any, Dict, List, Callable, Optional
+from collections import OrderedDict
 import time
 import functools
 import json
+import logging
+import sys
+import threading
+import weakref
 from datetime import datetime
 
+# Decorator diagnostics go through one module logger with %-style arguments,
+# so nothing is formatted unless INFO is enabled (the demo turns it on)
+_LOG = logging.getLogger(__name__)
+
+# Sentinel for cache lookups, since None is a valid cached result
+_MISSING = object()
+
 # ============================================================================
 # CORE SERVICE INTERFACE
 # ============================================================================
 
 class DataService(ABC):
     """Abstract data service interface"""
+    __slots__ = ()
+    
     @abstractmethod
     def get_data(self, query: str) -> str:
         pass
@@ -42,6 +56,8 @@ class DataService(ABC):
 
 class RealDataService(DataService):
     """Real data service that simulates database operations"""
+    __slots__ = ('_data_store', '_operation_count')
+    
     def __init__(self):
         self._data_store = {
             'users': ['John Doe', 'Jane Smith', 'Bob Wilson'],
@@ -73,14 +89,19 @@ class RealDataService(DataService):
 
 class DataServiceDecorator(DataService):
     """Base decorator class that maintains the same interface"""
+    __slots__ = ('_data_service', '_inner_get', '_inner_save')
+    
     def __init__(self, data_service: DataService):
         self._data_service = data_service
+        # Bound once so each call through the chain skips the super() lookup
+        self._inner_get = data_service.get_data
+        self._inner_save = data_service.save_data
     
     def get_data(self, query: str) -> str:
-        return self._data_service.get_data(query)
+        return self._inner_get(query)
     
     def save_data(self, data: str) -> bool:
-        return self._data_service.save_data(data)
+        return self._inner_save(data)
 
 # ============================================================================
 # CONCRETE DECORATORS
@@ -88,78 +109,138 @@ class DataServiceDecorator(DataService):
 
 class LoggingDecorator(DataServiceDecorator):
     """Decorator that adds logging functionality"""
-    def __init__(self, data_service: DataService, logger_name: str = "DataService"):
+    __slots__ = ('logger_name', 'log_count', 'enabled', 'timing')
+    
+    def __init__(self, data_service: DataService, logger_name: str = "DataService",
+                 enabled: bool = True, timing: bool = True):
         super().__init__(data_service)
         self.logger_name = logger_name
         self.log_count = 0
+        # When disabled, no message is formatted or printed; without timing
+        # the clock is not read and durations are left out
+        self.enabled = enabled
+        self.timing = timing
+    
+    def _duration(self, start_ns, preposition: str) -> str:
+        """' in 1.23ms' style suffix, empty when timing is off"""
+        if start_ns is None:
+            return ""
+        return f" {preposition} {(time.perf_counter_ns() - start_ns) / 1e6:.2f}ms"
     
     def get_data(self, query: str) -> str:
-        start_time = time.time()
         self.log_count += 1
+        if not (self.enabled and _LOG.isEnabledFor(logging.INFO)):
+            return self._inner_get(query)
         
-        print(f"📝 [{self.logger_name}] Log #{self.log_count}: GET request for '{query}'")
+        start_ns = time.perf_counter_ns() if self.timing else None
+        name, count = self.logger_name, self.log_count
+        _LOG.info("📝 [%s] Log #%d: GET request for '%s'", name, count, query)
         
         try:
-            result = super().get_data(query)
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
-            
-            print(f"📝 [{self.logger_name}] Log #{self.log_count}: GET completed in {duration:.2f}ms")
+            result = self._inner_get(query)
+            _LOG.info("📝 [%s] Log #%d: GET completed%s", name, count, self._duration(start_ns, 'in'))
             return result
         except Exception as e:
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
-            print(f"📝 [{self.logger_name}] Log #{self.log_count}: GET failed after {duration:.2f}ms - {e}")
+            _LOG.info("📝 [%s] Log #%d: GET failed%s - %s", name, count, self._duration(start_ns, 'after'), e)
             raise
     
     def save_data(self, data: str) -> bool:
-        start_time = time.time()
         self.log_count += 1
+        if not (self.enabled and _LOG.isEnabledFor(logging.INFO)):
+            return self._inner_save(data)
         
-        print(f"📝 [{self.logger_name}] Log #{self.log_count}: SAVE request for '{data[:50]}...'")
+        start_ns = time.perf_counter_ns() if self.timing else None
+        name, count = self.logger_name, self.log_count
+        _LOG.info("📝 [%s] Log #%d: SAVE request for '%.50s...'", name, count, data)
         
         try:
-            result = super().save_data(data)
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
-            
-            print(f"📝 [{self.logger_name}] Log #{self.log_count}: SAVE completed in {duration:.2f}ms")
+            result = self._inner_save(data)
+            _LOG.info("📝 [%s] Log #%d: SAVE completed%s", name, count, self._duration(start_ns, 'in'))
             return result
         except Exception as e:
-            end_time = time.time()
-            duration = (end_time - start_time) * 1000
-            print(f"📝 [{self.logger_name}] Log #{self.log_count}: SAVE failed after {duration:.2f}ms - {e}")
+            _LOG.info("📝 [%s] Log #%d: SAVE failed%s - %s", name, count, self._duration(start_ns, 'after'), e)
             raise
 
 class CachingDecorator(DataServiceDecorator):
     """Decorator that adds caching functionality"""
-    def __init__(self, data_service: DataService, cache_size: int = 100):
+    __slots__ = ('_cache', '_cache_size', '_cache_hits', '_cache_misses', '_lock', '_inflight',
+                 'weak_values')
+    
+    def __init__(self, data_service: DataService, cache_size: int = 100,
+                 weak_values: bool = False):
         super().__init__(data_service)
-        self._cache: Dict[str, str] = {}
+        # Least recently used entries first: hits move to the end, and
+        # eviction pops from the front, both O(1)
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
         self._cache_size = cache_size
         self._cache_hits = 0
         self._cache_misses = 0
+        # Concurrent misses on one key share a single backend fetch: the first
+        # thread registers an Event here and the others wait on it
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        # Hold results that support weak references (not str) only while the
+        # caller keeps them alive; a dead entry is treated as a miss
+        self.weak_values = weak_values
     
     def get_data(self, query: str) -> str:
-        # Check cache first
-        if query in self._cache:
-            self._cache_hits += 1
-            print(f"💾 [CACHE HIT] Query: '{query}' (Hit rate: {self._get_hit_rate():.1f}%)")
-            return self._cache[query]
+        pending = None
+        with self._lock:
+            # Check cache first
+            result = self._cache.get(query, _MISSING)
+            if self.weak_values and type(result) is weakref.ref:
+                result = result()
+                if result is None:
+                    del self._cache[query]
+                    result = _MISSING
+            hit = result is not _MISSING
+            if hit:
+                self._cache_hits += 1
+                self._cache.move_to_end(query)
+                hit_rate = self._get_hit_rate()
+            else:
+                pending = self._inflight.get(query)
+                if pending is None:
+                    # Cache miss - this thread fetches from the service
+                    self._cache_misses += 1
+                    hit_rate = self._get_hit_rate()
+                    self._inflight[query] = fetched = threading.Event()
         
-        # Cache miss - get from service
-        self._cache_misses += 1
-        print(f"💾 [CACHE MISS] Query: '{query}' (Hit rate: {self._get_hit_rate():.1f}%)")
+        if hit:
+            if _LOG.isEnabledFor(logging.INFO):
+                _LOG.info("💾 [CACHE HIT] Query: '%s' (Hit rate: %.1f%%)", query, hit_rate)
+            return result
         
-        result = super().get_data(query)
+        if pending is not None:
+            # Another thread is already fetching; once it finishes the value
+            # is cached (or, if it failed, this call fetches on its own)
+            pending.wait()
+            return self.get_data(query)
         
-        # Add to cache (with size limit)
-        if len(self._cache) >= self._cache_size:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info("💾 [CACHE MISS] Query: '%s' (Hit rate: %.1f%%)", query, hit_rate)
         
-        self._cache[query] = result
+        try:
+            result = self._inner_get(query)
+            with self._lock:
+                # Add to cache (with size limit)
+                if len(self._cache) >= self._cache_size:
+                    # Remove least recently used entry
+                    self._cache.popitem(last=False)
+                self._cache[query] = self._entry(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[query]
+            fetched.set()
+    
+    def _entry(self, result: Any) -> Any:
+        """Value to store for result: a weak reference when enabled and supported"""
+        if self.weak_values:
+            try:
+                return weakref.ref(result)
+            except TypeError:
+                pass
         return result
     
     def _get_hit_rate(self) -> float:
@@ -168,13 +249,20 @@ class CachingDecorator(DataServiceDecorator):
     
     def clear_cache(self):
         """Clear the cache"""
-        self._cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
-        print("💾 [CACHE] Cache cleared")
+        with self._lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+        _LOG.info("💾 [CACHE] Cache cleared")
 
 class ValidationDecorator(DataServiceDecorator):
     """Decorator that adds input validation"""
+    __slots__ = ('validation_errors',)
+    
+    # Characters rejected in queries (basic XSS prevention); translate() drops
+    # them in a single table-driven pass, so a shorter result means a hit
+    _XSS_TABLE = str.maketrans('', '', '<>&"\'')
+    
     def __init__(self, data_service: DataService):
         super().__init__(data_service)
         self.validation_errors = 0
@@ -184,28 +272,29 @@ class ValidationDecorator(DataServiceDecorator):
             self.validation_errors += 1
             raise ValueError(f"Invalid query: '{query}'")
         
-        return super().get_data(query)
+        return self._inner_get(query)
     
     def save_data(self, data: str) -> bool:
         if not self._validate_data(data):
             self.validation_errors += 1
-            raise ValueError(f"Invalid data: '{data[:50]}...'")
+            raise ValueError(f"Invalid data: '{data:.50}...'")
         
-        return super().save_data(data)
+        return self._inner_save(data)
     
     def _validate_query(self, query: str) -> bool:
         """Validate query parameters"""
-        if not query or len(query.strip()) == 0:
+        # isspace() checks for blank input without allocating a stripped copy
+        if not query or query.isspace():
             return False
         if len(query) > 100:
             return False
-        if any(char in query for char in ['<', '>', '&', '"', "'"]):
+        if len(query.translate(self._XSS_TABLE)) != len(query):
             return False  # Basic XSS prevention
         return True
     
     def _validate_data(self, data: str) -> bool:
         """Validate data before saving"""
-        if not data or len(data.strip()) == 0:
+        if not data or data.isspace():
             return False
         if len(data) > 1000:
             return False
@@ -213,79 +302,100 @@ class ValidationDecorator(DataServiceDecorator):
 
 class RetryDecorator(DataServiceDecorator):
     """Decorator that adds retry functionality"""
-    def __init__(self, data_service: DataService, max_retries: int = 3, delay: float = 0.1):
+    __slots__ = ('max_retries', 'delay', 'max_delay', 'total_budget', 'retry_count')
+    
+    def __init__(self, data_service: DataService, max_retries: int = 3, delay: float = 0.1,
+                 max_delay: float = 2.0, total_budget: Optional[float] = None):
         super().__init__(data_service)
         self.max_retries = max_retries
-        self.delay = delay
+        self.delay = delay  # first back-off; doubles after every failed attempt
+        self.max_delay = max_delay
+        self.total_budget = total_budget  # seconds for all attempts, None = unlimited
         self.retry_count = 0
     
-    def get_data(self, query: str) -> str:
+    def _call(self, operation: Callable[[Any], Any], argument: Any) -> Any:
+        """Run operation(argument) with exponential back-off between attempts"""
+        deadline = None if self.total_budget is None else time.monotonic() + self.total_budget
         for attempt in range(self.max_retries + 1):
             try:
-                return super().get_data(query)
+                return operation(argument)
             except Exception as e:
-                if attempt < self.max_retries:
-                    self.retry_count += 1
-                    print(f"🔄 [RETRY] Attempt {attempt + 1} failed: {e}. Retrying in {self.delay}s...")
-                    time.sleep(self.delay)
-                else:
-                    print(f"🔄 [RETRY] All {self.max_retries + 1} attempts failed")
+                if attempt >= self.max_retries:
+                    _LOG.info("🔄 [RETRY] All %d attempts failed", self.max_retries + 1)
                     raise
+                wait = min(self.delay * (1 << attempt), self.max_delay)
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    _LOG.info("🔄 [RETRY] Retry budget of %ss exhausted after %d attempts",
+                              self.total_budget, attempt + 1)
+                    raise
+                self.retry_count += 1
+                _LOG.info("🔄 [RETRY] Attempt %d failed: %s. Retrying in %ss...", attempt + 1, e, wait)
+                time.sleep(wait)
+    
+    def get_data(self, query: str) -> str:
+        # With no retries configured there is nothing to catch or wait for
+        if not self.max_retries:
+            return self._inner_get(query)
+        return self._call(self._inner_get, query)
     
     def save_data(self, data: str) -> bool:
-        for attempt in range(self.max_retries + 1):
-            try:
-                return super().save_data(data)
-            except Exception as e:
-                if attempt < self.max_retries:
-                    self.retry_count += 1
-                    print(f"🔄 [RETRY] Attempt {attempt + 1} failed: {e}. Retrying in {self.delay}s...")
-                    time.sleep(self.delay)
-                else:
-                    print(f"🔄 [RETRY] All {self.max_retries + 1} attempts failed")
-                    raise
+        if not self.max_retries:
+            return self._inner_save(data)
+        return self._call(self._inner_save, data)
 
 class MetricsDecorator(DataServiceDecorator):
     """Decorator that collects performance metrics"""
+    __slots__ = ('get_requests', 'save_requests', 'total_get_ns', 'total_save_ns', 'errors')
+    
     def __init__(self, data_service: DataService):
         super().__init__(data_service)
-        self.metrics = {
-            'get_requests': 0,
-            'save_requests': 0,
-            'total_get_time': 0.0,
-            'total_save_time': 0.0,
-            'errors': 0
-        }
+        # Plain counters; durations are integer nanoseconds (no float drift)
+        self.get_requests = 0
+        self.save_requests = 0
+        self.total_get_ns = 0
+        self.total_save_ns = 0
+        self.errors = 0
     
     def get_data(self, query: str) -> str:
-        start_time = time.time()
-        self.metrics['get_requests'] += 1
+        start = time.perf_counter_ns()
+        self.get_requests += 1
         
         try:
-            result = super().get_data(query)
-            end_time = time.time()
-            self.metrics['total_get_time'] += (end_time - start_time)
+            result = self._inner_get(query)
+            self.total_get_ns += time.perf_counter_ns() - start
             return result
         except Exception as e:
-            self.metrics['errors'] += 1
+            self.errors += 1
             raise
     
     def save_data(self, data: str) -> bool:
-        start_time = time.time()
-        self.metrics['save_requests'] += 1
+        start = time.perf_counter_ns()
+        self.save_requests += 1
         
         try:
-            result = super().save_data(data)
-            end_time = time.time()
-            self.metrics['total_save_time'] += (end_time - start_time)
+            result = self._inner_save(data)
+            self.total_save_ns += time.perf_counter_ns() - start
             return result
         except Exception as e:
-            self.metrics['errors'] += 1
+            self.errors += 1
             raise
     
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Raw counters as a dict (built on demand)"""
+        return {
+            'get_requests': self.get_requests,
+            'save_requests': self.save_requests,
+            'total_get_ns': self.total_get_ns,
+            'total_save_ns': self.total_save_ns,
+            'errors': self.errors
+        }
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get performance metrics"""
-        metrics = self.metrics.copy()
+        metrics = self.metrics
+        metrics['total_get_time'] = metrics['total_get_ns'] / 1e9
+        metrics['total_save_time'] = metrics['total_save_ns'] / 1e9
         
         if metrics['get_requests'] > 0:
             metrics['avg_get_time'] = metrics['total_get_time'] / metrics['get_requests']
@@ -317,10 +427,10 @@ def timing_decorator(func: Callable) -> Callable:
     """Function decorator that measures execution time"""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"⏱️  Function '{func.__name__}' executed in {(end_time - start_time)*1000:.2f}ms")
+        elapsed_ns = time.perf_counter_ns() - start
+        _LOG.info("⏱️  Function '%s' executed in %.2fms", func.__name__, elapsed_ns / 1e6)
         return result
     return wrapper
 
@@ -334,7 +444,7 @@ def retry_decorator(max_retries: int = 3, delay: float = 0.1):
                     return func(*args, **kwargs)
                 except Exception as e:
                     if attempt < max_retries:
-                        print(f"🔄 Retry {attempt + 1}/{max_retries} for {func.__name__}: {e}")
+                        _LOG.info("🔄 Retry %d/%d for %s: %s", attempt + 1, max_retries, func.__name__, e)
                         time.sleep(delay)
                     else:
                         raise
@@ -345,30 +455,36 @@ def retry_decorator(max_retries: int = 3, delay: float = 0.1):
 def cache_decorator(cache_size: int = 100):
     """Function decorator that adds caching"""
     def decorator(func: Callable) -> Callable:
-        cache = {}
+        # Keying, lookup and LRU eviction all happen in functools' C cache;
+        # the wrapper only reports whether the call was served from it
+        cached = functools.lru_cache(maxsize=cache_size)(func)
+        cache_info = cached.cache_info
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from arguments
-            cache_key = str(args) + str(sorted(kwargs.items()))
-            
-            if cache_key in cache:
-                print(f"💾 Cache hit for {func.__name__}")
-                return cache[cache_key]
-            
-            print(f"💾 Cache miss for {func.__name__}")
-            result = func(*args, **kwargs)
-            
-            # Add to cache with size limit
-            if len(cache) >= cache_size:
-                # Remove oldest entry
-                oldest_key = next(iter(cache))
-                del cache[oldest_key]
+            try:
+                if not _LOG.isEnabledFor(logging.INFO):
+                    return cached(*args, **kwargs)
+                misses = cache_info().misses
+                result = cached(*args, **kwargs)
+            except TypeError:
+                # Unhashable arguments (lists, dicts) cannot form a key, so
+                # run uncached rather than fail; errors raised by func itself
+                # propagate untouched
+                try:
+                    hash((args, tuple(kwargs.items())))
+                except TypeError:
+                    return func(*args, **kwargs)
+                raise
             
-            cache[cache_key] = result
+            if cache_info().misses == misses:
+                _LOG.info("💾 Cache hit for %s", func.__name__)
+            else:
+                _LOG.info("💾 Cache miss for %s", func.__name__)
             return result
         
-        wrapper.clear_cache = lambda: cache.clear()
+        wrapper.clear_cache = cached.cache_clear
+        wrapper.cache_info = cache_info
         return wrapper
     return decorator
 
@@ -384,11 +500,22 @@ def expensive_calculation(n: int) -> int:
     time.sleep(0.1)  # Simulate work
     return n * n * n
 
+def _enable_demo_logging():
+    """Show the decorator log messages on stdout (idempotent)"""
+    if not any(getattr(h, '_decorator_demo', False) for h in _LOG.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._decorator_demo = True
+        _LOG.addHandler(handler)
+    _LOG.setLevel(logging.INFO)
+
 def demo_decorator_interview():
     """
     🎯 INTERVIEW DEMO: Decorator Pattern
     Demonstrates class-based and function-based decorators
     """
+    _enable_demo_logging()
+    
     print("\n" + "="*60)
     print("🚀 DECORATOR PATTERN - INTERVIEW DEMO")
     print("="*60)
@@ -411,10 +538,11 @@ def demo_decorator_interview():
     
     # Build decorated service with multiple decorators
     print("\n🔧 Building decorated service with multiple decorators:")
-    service = base_service
-    service = MetricsDecorator(service)
-    service = LoggingDecorator(service, "MainService")
-    service = CachingDecorator(service, cache_size=3)
+    # Keep handles on the layers we report on; the outer wrapper hides them
+    metrics_layer = MetricsDecorator(base_service)
+    service = LoggingDecorator(metrics_layer, "MainService")
+    cache_layer = CachingDecorator(service, cache_size=3)
+    service = cache_layer
     service = ValidationDecorator(service)
     service = RetryDecorator(service, max_retries=2, delay=0.05)
     
@@ -446,15 +574,13 @@ def demo_decorator_interview():
         print(f"   Validation caught: {e}")
     
     # Show metrics
-    if isinstance(service, MetricsDecorator):
-        service.print_metrics()
+    metrics_layer.print_metrics()
     
     # Show cache statistics
-    if isinstance(service, CachingDecorator):
-        print(f"\n💾 Cache statistics:")
-        print(f"   Cache hits: {service._cache_hits}")
-        print(f"   Cache misses: {service._cache_misses}")
-        print(f"   Hit rate: {service._get_hit_rate():.1f}%")
+    print(f"\n💾 Cache statistics:")
+    print(f"   Cache hits: {cache_layer._cache_hits}")
+    print(f"   Cache misses: {cache_layer._cache_misses}")
+    print(f"   Hit rate: {cache_layer._get_hit_rate():.1f}%")
     
     # ========================================================================
     # FUNCTION-BASED DECORATORS DEMO
@@ -21,6 +21,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from enum import Enum
 import json
+import sys
 
 # ============================================================================
 # SIMPLE FACTORY PATTERN
@@ -418,38 +419,140 @@ class UIFactoryProvider:
 # DEMO FUNCTIONS
 # ============================================================================
 
+# Static demo text, assembled once at import time and written as whole blocks
+# rather than one print() call per line
+
+_EQ50 = "=" * 50
+_EQ60 = "=" * 60
+
+def _section(title: str) -> str:
+    """Banner for a demo section"""
+    return f"\n{_EQ50}\n{title}\n{_EQ50}\n"
+
+_FACTORY_INTRO = f"""
+{_EQ60}
+🚀 FACTORY PATTERNS - INTERVIEW DEMO
+{_EQ60}
+
+💡 Common interview questions:
+1. How to create objects without knowing their exact classes?
+2. What's the difference between Simple Factory, Factory Method, and Abstract Factory?
+3. How to add new product types without modifying existing code?
+4. How to create families of related objects?
+"""
+
+_SIMPLE_FACTORY_HEADER = _section("🏭 SIMPLE FACTORY PATTERN DEMO") + """
+💳 Processing payments with Simple Factory:
+"""
+
+_FACTORY_METHOD_HEADER = _section("🏭 FACTORY METHOD PATTERN DEMO") + """
+📄 Creating documents with Factory Method:
+"""
+
+_ABSTRACT_FACTORY_HEADER = _section("🏭 ABSTRACT FACTORY PATTERN DEMO") + """
+🎨 Creating UI components with Abstract Factory:
+"""
+
+_FACTORY_COMPARISON = _section("📊 FACTORY PATTERNS COMPARISON") + """
+🔍 Pattern Comparison:
+┌─────────────────┬─────────────────┬─────────────────┬─────────────────┐
+│ Pattern         │ Complexity      │ Flexibility     │ Use Case        │
+├─────────────────┼─────────────────┼─────────────────┼─────────────────┤
+│ Simple Factory  │ Low             │ Low             │ Single product  │
+│ Factory Method  │ Medium          │ High            │ Product family  │
+│ Abstract Factory│ High            │ Very High       │ Product families│
+└─────────────────┴─────────────────┴─────────────────┴─────────────────┘
+
+🎯 When to Use Each Pattern:
+   1. 🏭 Simple Factory:
+      - Single product type with multiple implementations
+      - Simple object creation logic
+      - Configuration-driven creation
+      - Example: Payment processors, database connections
+
+   2. 🏭 Factory Method:
+      - Product family with common interface
+      - Need to defer instantiation to subclasses
+      - Framework/library design
+      - Example: Document creators, logger factories
+
+   3. 🏭 Abstract Factory:
+      - Multiple related product families
+      - Need to ensure products work together
+      - Platform-specific implementations
+      - Example: UI themes, database providers
+"""
+
+_FACTORY_EXTENSIBILITY = _section("🔧 EXTENSIBILITY DEMO") + """
+💡 Adding new payment method (Simple Factory):
+   1. Create new processor class
+   2. Add to factory mapping
+   3. No changes to existing code
+
+💡 Adding new document type (Factory Method):
+   1. Create new document class
+   2. Create new document creator
+   3. No changes to existing code
+
+💡 Adding new UI theme (Abstract Factory):
+   1. Create new component classes
+   2. Create new theme factory
+   3. Add to factory provider
+   4. No changes to existing code
+"""
+
+_FACTORY_REAL_WORLD = _section("🌍 REAL-WORLD EXAMPLES") + """
+📚 Common Factory Pattern Examples:
+   🏭 Simple Factory:
+      - java.util.Calendar.getInstance()
+      - Spring BeanFactory
+      - Database connection factories
+
+   🏭 Factory Method:
+      - java.util.Collections.unmodifiableList()
+      - React.createElement()
+      - Logger factories (Log4j, SLF4J)
+
+   🏭 Abstract Factory:
+      - javax.xml.parsers.DocumentBuilderFactory
+      - GUI toolkit factories (Swing, JavaFX)
+      - Database provider factories
+"""
+
+_ERROR_HANDLING_HEADER = _section("⚠️ ERROR HANDLING DEMO") + """
+🧪 Testing error scenarios:
+"""
+
+# Demo inputs, built once at import time
+_PAYMENT_CASES = (
+    (PaymentMethod.CREDIT_CARD, "user123"),
+    (PaymentMethod.PAYPAL, "user456"),
+    (PaymentMethod.CRYPTOCURRENCY, "user789"),
+)
+
+_DOCUMENT_CASES = (
+    (PDFDocumentCreator, "Report", "This is a PDF report content", "report.pdf"),
+    (WordDocumentCreator, "Letter", "This is a Word document content", "letter.docx"),
+    (TextDocumentCreator, "Notes", "This is plain text content", "notes.txt"),
+)
+
+_THEMES = (UITheme.LIGHT, UITheme.DARK, UITheme.HIGH_CONTRAST)
+
 def demo_factory_interview():
     """
     🎯 INTERVIEW DEMO: Factory Patterns
     Demonstrates Simple Factory, Factory Method, and Abstract Factory
     """
-    print("\n" + "="*60)
-    print("🚀 FACTORY PATTERNS - INTERVIEW DEMO")
-    print("="*60)
-    
-    print("\n💡 Common interview questions:")
-    print("1. How to create objects without knowing their exact classes?")
-    print("2. What's the difference between Simple Factory, Factory Method, and Abstract Factory?")
-    print("3. How to add new product types without modifying existing code?")
-    print("4. How to create families of related objects?")
+    write = sys.stdout.write
+    write(_FACTORY_INTRO)
     
     # ========================================================================
     # SIMPLE FACTORY DEMO
     # ========================================================================
-    print("\n" + "="*50)
-    print("🏭 SIMPLE FACTORY PATTERN DEMO")
-    print("="*50)
-    
-    print("\n💳 Processing payments with Simple Factory:")
+    write(_SIMPLE_FACTORY_HEADER)
     
     # Process different payment methods
-    payment_methods = [
-        (PaymentMethod.CREDIT_CARD, "user123"),
-        (PaymentMethod.PAYPAL, "user456"),
-        (PaymentMethod.CRYPTOCURRENCY, "user789")
-    ]
-    
-    for method, account_id in payment_methods:
+    for method, account_id in _PAYMENT_CASES:
         try:
             processor = PaymentProcessorFactory.create_processor(method, account_id)
             result = processor.process_payment(100.0, "USD")
@@ -460,21 +563,12 @@ def demo_factory_interview():
     # ========================================================================
     # FACTORY METHOD DEMO
     # ========================================================================
-    print("\n" + "="*50)
-    print("🏭 FACTORY METHOD PATTERN DEMO")
-    print("="*50)
-    
-    print("\n📄 Creating documents with Factory Method:")
+    write(_FACTORY_METHOD_HEADER)
     
     # Create different document types
-    creators = [
-        (PDFDocumentCreator(), "Report", "This is a PDF report content", "report.pdf"),
-        (WordDocumentCreator(), "Letter", "This is a Word document content", "letter.docx"),
-        (TextDocumentCreator(), "Notes", "This is plain text content", "notes.txt")
-    ]
-    
-    for creator, title, content, filename in creators:
+    for creator_class, title, content, filename in _DOCUMENT_CASES:
         try:
+            creator = creator_class()
             success = creator.create_and_save_document(title, content, filename)
             if success:
                 document = creator.create_document(title, content)
@@ -485,18 +579,12 @@ def demo_factory_interview():
     # ========================================================================
     # ABSTRACT FACTORY DEMO
     # ========================================================================
-    print("\n" + "="*50)
-    print("🏭 ABSTRACT FACTORY PATTERN DEMO")
-    print("="*50)
-    
-    print("\n🎨 Creating UI components with Abstract Factory:")
-    
-    # Create UI components for different themes
-    themes = [UITheme.LIGHT, UITheme.DARK, UITheme.HIGH_CONTRAST]
+    write(_ABSTRACT_FACTORY_HEADER)
     
-    for theme in themes:
-        print(f"\n🎨 Creating {theme.value} theme components:")
-        
+    # Create UI components for different themes; rendering has no side
+    # effects, so each theme's lines go out in one write
+    for theme in _THEMES:
+        heading = f"\n🎨 Creating {theme.value} theme components:\n"
         try:
             factory = UIFactoryProvider.get_factory(theme)
             
@@ -506,102 +594,25 @@ def demo_factory_interview():
             text_field.set_value("John Doe")
             
             # Render components
-            print(f"   {button.render()}")
-            print(f"   {text_field.render()}")
-            print(f"   Theme: {factory.get_theme_name()}")
+            write(heading +
+                  f"   {button.render()}\n"
+                  f"   {text_field.render()}\n"
+                  f"   Theme: {factory.get_theme_name()}\n")
             
         except ValueError as e:
-            print(f"❌ Theme creation failed: {e}")
-    
-    # ========================================================================
-    # FACTORY PATTERNS COMPARISON
-    # ========================================================================
-    print("\n" + "="*50)
-    print("📊 FACTORY PATTERNS COMPARISON")
-    print("="*50)
-    
-    print("\n🔍 Pattern Comparison:")
-    print("┌─────────────────┬─────────────────┬─────────────────┬─────────────────┐")
-    print("│ Pattern         │ Complexity      │ Flexibility     │ Use Case        │")
-    print("├─────────────────┼─────────────────┼─────────────────┼─────────────────┤")
-    print("│ Simple Factory  │ Low             │ Low             │ Single product  │")
-    print("│ Factory Method  │ Medium          │ High            │ Product family  │")
-    print("│ Abstract Factory│ High            │ Very High       │ Product families│")
-    print("└─────────────────┴─────────────────┴─────────────────┴─────────────────┘")
-    
-    print("\n🎯 When to Use Each Pattern:")
-    print("   1. 🏭 Simple Factory:")
-    print("      - Single product type with multiple implementations")
-    print("      - Simple object creation logic")
-    print("      - Configuration-driven creation")
-    print("      - Example: Payment processors, database connections")
-    
-    print("\n   2. 🏭 Factory Method:")
-    print("      - Product family with common interface")
-    print("      - Need to defer instantiation to subclasses")
-    print("      - Framework/library design")
-    print("      - Example: Document creators, logger factories")
-    
-    print("\n   3. 🏭 Abstract Factory:")
-    print("      - Multiple related product families")
-    print("      - Need to ensure products work together")
-    print("      - Platform-specific implementations")
-    print("      - Example: UI themes, database providers")
+            write(f"{heading}❌ Theme creation failed: {e}\n")
     
     # ========================================================================
-    # EXTENSIBILITY DEMO
+    # FACTORY PATTERNS COMPARISON, EXTENSIBILITY, REAL-WORLD EXAMPLES
     # ========================================================================
-    print("\n" + "="*50)
-    print("🔧 EXTENSIBILITY DEMO")
-    print("="*50)
-    
-    print("\n💡 Adding new payment method (Simple Factory):")
-    print("   1. Create new processor class")
-    print("   2. Add to factory mapping")
-    print("   3. No changes to existing code")
-    
-    print("\n💡 Adding new document type (Factory Method):")
-    print("   1. Create new document class")
-    print("   2. Create new document creator")
-    print("   3. No changes to existing code")
-    
-    print("\n💡 Adding new UI theme (Abstract Factory):")
-    print("   1. Create new component classes")
-    print("   2. Create new theme factory")
-    print("   3. Add to factory provider")
-    print("   4. No changes to existing code")
-    
-    # ========================================================================
-    # REAL-WORLD EXAMPLES
-    # ========================================================================
-    print("\n" + "="*50)
-    print("🌍 REAL-WORLD EXAMPLES")
-    print("="*50)
-    
-    print("\n📚 Common Factory Pattern Examples:")
-    print("   🏭 Simple Factory:")
-    print("      - java.util.Calendar.getInstance()")
-    print("      - Spring BeanFactory")
-    print("      - Database connection factories")
-    
-    print("\n   🏭 Factory Method:")
-    print("      - java.util.Collections.unmodifiableList()")
-    print("      - React.createElement()")
-    print("      - Logger factories (Log4j, SLF4J)")
-    
-    print("\n   🏭 Abstract Factory:")
-    print("      - javax.xml.parsers.DocumentBuilderFactory")
-    print("      - GUI toolkit factories (Swing, JavaFX)")
-    print("      - Database provider factories")
+    write(_FACTORY_COMPARISON)
+    write(_FACTORY_EXTENSIBILITY)
+    write(_FACTORY_REAL_WORLD)
     
     # ========================================================================
     # ERROR HANDLING DEMO
     # ========================================================================
-    print("\n" + "="*50)
-    print("⚠️ ERROR HANDLING DEMO")
-    print("="*50)
-    
-    print("\n🧪 Testing error scenarios:")
+    write(_ERROR_HANDLING_HEADER)
     
     # Test unsupported payment method
     print("\nTesting unsupported payment method:")
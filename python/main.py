@@ -25,241 +25,290 @@ interview-focused examples and explanations.
 5. Command Pattern - Undo/Redo & Transaction Management
 '''
 
+import importlib
 import sys
 import os
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, NamedTuple, Tuple
 
-# Add current directory to path for imports
+# Add current directory to path for imports; pattern modules are imported
+# on first use (see DesignPatternsMenu._resolve_demo), not at startup
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import pattern demos
-try:
-    from observer_pattern import demo_observer_interview
-    from strategy_patttern import demo_strategy_interview
-    from adapter_pattern import demo_adapter_interview
-    from decorator_pattern import demo_decorator_interview
-    from command_pattern import demo_command_interview
-    from memento_pattern import demo_memento_interview
-    from visitor_pattern import demo_visitor_interview
-    from template_method_pattern import demo_template_method_interview
-    from composite_pattern import demo_composite_interview
-    from builder_pattern import demo_builder_interview
-    from factory_patterns import demo_factory_interview
-    from singleton_pattern import demo_singleton_interview
-except ImportError as e:
-    print(f"❌ Error importing pattern modules: {e}")
-    print("Make sure all pattern files are in the same directory as main.py")
-    sys.exit(1)
+# Answers accepted as "yes", and the menu choices that pause afterwards
+_YES = frozenset(('y', 'yes'))
+_INFO_CHOICES = frozenset(('13', '14'))
+
+# DPIP_NONINTERACTIVE=1 skips the follow-up prompts (scripted runs, timing)
+_NONINTERACTIVE = os.environ.get('DPIP_NONINTERACTIVE') == '1'
+
+# Separator rules and static screens, built once
+_EQ60 = "=" * 60
+_EQ80 = "=" * 80
+_DASH50 = "-" * 50
+_HEADER_TEXT = f"""
+{_EQ80}
+🚀 DESIGN PATTERNS INTERVIEW PREP 🚀
+{_EQ80}
+Master the most common design patterns asked in technical interviews!
+Each pattern includes real-world examples, edge cases, and interview scenarios.
+{_EQ80}
+"""
+_MENU_FOOTER = f"""13. 📖 Interview Tips & Common Questions
+14. 🎯 Quick Pattern Comparison
+15. 🚪 Exit
+{_DASH50}
+"""
+_TIPS_STRATEGY = f"""
+🎯 Pattern Selection Strategy:
+   1. Start with the problem you're trying to solve
+   2. Explain why this pattern is the best choice
+   3. Show a simple implementation
+   4. Discuss edge cases and error handling
+   5. Mention alternatives and trade-offs
+
+{_EQ60}
+"""
+
+_COMPARISON = {
+    'Observer': 'Event handling, notifications, MVC',
+    'Strategy': 'Algorithm selection, validation, payment processing',
+    'Adapter': 'Legacy integration, interface compatibility',
+    'Decorator': 'Adding features, middleware, cross-cutting concerns',
+    'Command': 'Undo/redo, queuing, macro operations'
+}
+_COMPARISON_TEXT = "".join((
+    f"\n{_EQ80}\n🎯 QUICK PATTERN COMPARISON\n{_EQ80}\n\n📊 When to Use Each Pattern:\n{_DASH50}\n",
+    "".join(f"🔹 {pattern:12} → {use_case}\n" for pattern, use_case in _COMPARISON.items()),
+    f"""
+🤔 Pattern Selection Guide:
+   • Need notifications? → Observer
+   • Multiple algorithms? → Strategy
+   • Incompatible interfaces? → Adapter
+   • Add features dynamically? → Decorator
+   • Need undo/redo? → Command
+
+{_EQ80}
+""",
+))
+
+class PatternInfo(NamedTuple):
+    """Menu entry for one pattern (immutable, tuple-backed)"""
+    name: str
+    description: str
+    demo: Tuple[str, str]  # (module, function), imported on first run
+    interview_questions: Tuple[str, ...]
+    real_world_examples: Tuple[str, ...]
 
 class DesignPatternsMenu:
     """Main menu system for design patterns interview prep"""
+    __slots__ = ('patterns', 'help_info', '_demos', '_menu_text', '_tips_text')
     
     def __init__(self):
-        self.patterns = {
-            '1': {
-                'name': 'Observer Pattern - Event System & Notifications',
-                'description': 'One-to-many dependency between objects. When one object changes state, all dependents are notified.',
-                'demo': demo_observer_interview,
-                'interview_questions': [
+        self.patterns: Dict[str, PatternInfo] = {
+            '1': PatternInfo(
+                name='Observer Pattern - Event System & Notifications',
+                description='One-to-many dependency between objects. When one object changes state, all dependents are notified.',
+                demo=('observer_pattern', 'demo_observer_interview'),
+                interview_questions=(
                     'How would you design a notification system?',
                     'What if an observer takes too long to process?',
                     'How to prevent memory leaks with observers?',
                     'How to handle failing observers gracefully?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Event-driven architectures',
                     'Model-View-Controller (MVC)',
                     'Publish-Subscribe systems',
                     'Notification systems'
-                ]
-            },
-            '2': {
-                'name': 'Strategy Pattern - Validation & Algorithm Selection',
-                'description': 'Define a family of algorithms, encapsulate each one, and make them interchangeable.',
-                'demo': demo_strategy_interview,
-                'interview_questions': [
+                )
+            ),
+            '2': PatternInfo(
+                name='Strategy Pattern - Validation & Algorithm Selection',
+                description='Define a family of algorithms, encapsulate each one, and make them interchangeable.',
+                demo=('strategy_patttern', 'demo_strategy_interview'),
+                interview_questions=(
                     'How to make validation rules configurable?',
                     'When would you use Strategy vs Template Method?',
                     'How to dynamically change algorithms at runtime?',
                     'How to combine multiple strategies?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Payment processing systems',
                     'Data validation frameworks',
                     'Sorting algorithms',
                     'Compression algorithms'
-                ]
-            },
-            '3': {
-                'name': 'Adapter Pattern - Legacy Integration & Data Transformation',
-                'description': 'Allows incompatible interfaces to work together by wrapping existing classes.',
-                'demo': demo_adapter_interview,
-                'interview_questions': [
+                )
+            ),
+            '3': PatternInfo(
+                name='Adapter Pattern - Legacy Integration & Data Transformation',
+                description='Allows incompatible interfaces to work together by wrapping existing classes.',
+                demo=('adapter_pattern', 'demo_adapter_interview'),
+                interview_questions=(
                     'How to integrate with a legacy system you can\'t modify?',
                     'What if you need two-way adaptation?',
                     'How to handle incompatible interfaces?',
                     'How to handle data transformation between systems?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Legacy system integration',
                     'Third-party API wrappers',
                     'Data format converters',
                     'Database adapters'
-                ]
-            },
-            '4': {
-                'name': 'Decorator Pattern - Middleware & Cross-cutting Concerns',
-                'description': 'Add behavior to objects dynamically without altering their structure.',
-                'demo': demo_decorator_interview,
-                'interview_questions': [
+                )
+            ),
+            '4': PatternInfo(
+                name='Decorator Pattern - Middleware & Cross-cutting Concerns',
+                description='Add behavior to objects dynamically without altering their structure.',
+                demo=('decorator_pattern', 'demo_decorator_interview'),
+                interview_questions=(
                     'How to add logging/caching without modifying existing code?',
                     'What\'s the difference between Decorator and Proxy?',
                     'How to manage decorator order?',
                     'How to implement middleware functionality?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Web middleware (logging, authentication)',
                     'Caching layers',
                     'Input validation',
                     'Performance monitoring'
-                ]
-            },
-            '5': {
-                'name': 'Command Pattern - Undo/Redo & Transaction Management',
-                'description': 'Encapsulate requests as objects, allowing parameterization, queuing, and undo operations.',
-                'demo': demo_command_interview,
-                'interview_questions': [
+                )
+            ),
+            '5': PatternInfo(
+                name='Command Pattern - Undo/Redo & Transaction Management',
+                description='Encapsulate requests as objects, allowing parameterization, queuing, and undo operations.',
+                demo=('command_pattern', 'demo_command_interview'),
+                interview_questions=(
                     'How to implement undo/redo in a text editor?',
                     'What about transactional operations?',
                     'How to handle command queuing?',
                     'How to implement macro commands?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Text editors with undo/redo',
                     'Database transactions',
                     'GUI button actions',
                     'Remote procedure calls'
-                ]
-            },
-            '6': {
-                'name': 'Memento Pattern - State Restoration & Checkpoints',
-                'description': 'Capture and externalize an object\'s internal state for later restoration.',
-                'demo': demo_memento_interview,
-                'interview_questions': [
+                )
+            ),
+            '6': PatternInfo(
+                name='Memento Pattern - State Restoration & Checkpoints',
+                description='Capture and externalize an object\'s internal state for later restoration.',
+                demo=('memento_pattern', 'demo_memento_interview'),
+                interview_questions=(
                     'How to implement save/restore functionality in a game?',
                     'How to implement undo/redo with state snapshots?',
                     'How to handle version control for object states?',
                     'How to implement checkpoint/rollback systems?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Game save systems',
                     'Document editors with undo/redo',
                     'Database transactions',
                     'Configuration management'
-                ]
-            },
-            '7': {
-                'name': 'Visitor Pattern - Operations on Object Structures',
-                'description': 'Define operations on object structures without changing the classes.',
-                'demo': demo_visitor_interview,
-                'interview_questions': [
+                )
+            ),
+            '7': PatternInfo(
+                name='Visitor Pattern - Operations on Object Structures',
+                description='Define operations on object structures without changing the classes.',
+                demo=('visitor_pattern', 'demo_visitor_interview'),
+                interview_questions=(
                     'How to add new operations to existing classes without modifying them?',
                     'How to implement type-safe operations on heterogeneous collections?',
                     'How to separate algorithms from object structure?',
                     'How to implement double dispatch in single-dispatch languages?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Document processing systems',
                     'Compiler AST visitors',
                     'File system operations',
                     'GUI component rendering'
-                ]
-            },
-            '8': {
-                'name': 'Template Method Pattern - Algorithm Skeletons',
-                'description': 'Define algorithm skeleton with customizable steps in subclasses.',
-                'demo': demo_template_method_interview,
-                'interview_questions': [
+                )
+            ),
+            '8': PatternInfo(
+                name='Template Method Pattern - Algorithm Skeletons',
+                description='Define algorithm skeleton with customizable steps in subclasses.',
+                demo=('template_method_pattern', 'demo_template_method_interview'),
+                interview_questions=(
                     'How to define a common algorithm structure with customizable steps?',
                     'How to avoid code duplication in similar algorithms?',
                     'How to enforce a specific order of operations?',
                     'How to implement the Hollywood Principle?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Framework lifecycle methods',
                     'Build systems (Maven, Gradle)',
                     'Data processing pipelines',
                     'Game engine update loops'
-                ]
-            },
-            '9': {
-                'name': 'Composite Pattern - Tree Structures & Hierarchies',
-                'description': 'Compose objects into tree structures to represent part-whole hierarchies.',
-                'demo': demo_composite_interview,
-                'interview_questions': [
+                )
+            ),
+            '9': PatternInfo(
+                name='Composite Pattern - Tree Structures & Hierarchies',
+                description='Compose objects into tree structures to represent part-whole hierarchies.',
+                demo=('composite_pattern', 'demo_composite_interview'),
+                interview_questions=(
                     'How to represent hierarchical structures like file systems?',
                     'How to implement tree operations uniformly on leaves and composites?',
                     'How to build complex UI component hierarchies?',
                     'How to implement organizational structures or menu systems?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'File system structures',
                     'GUI component hierarchies',
                     'Organizational charts',
                     'Menu systems'
-                ]
-            },
-            '10': {
-                'name': 'Builder Pattern - Complex Object Construction',
-                'description': 'Separate object construction from representation for flexible building.',
-                'demo': demo_builder_interview,
-                'interview_questions': [
+                )
+            ),
+            '10': PatternInfo(
+                name='Builder Pattern - Complex Object Construction',
+                description='Separate object construction from representation for flexible building.',
+                demo=('builder_pattern', 'demo_builder_interview'),
+                interview_questions=(
                     'How to create complex objects with many optional parameters?',
                     'How to build objects step by step with validation?',
                     'How to create different representations of the same object?',
                     'How to make object construction more readable and maintainable?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'StringBuilder in Java/C#',
                     'Query builders (SQL, MongoDB)',
                     'Configuration builders',
                     'HTTP request builders'
-                ]
-            },
-            '11': {
-                'name': 'Factory Patterns - Object Creation (Simple, Method, Abstract)',
-                'description': 'Create objects without specifying their exact classes.',
-                'demo': demo_factory_interview,
-                'interview_questions': [
+                )
+            ),
+            '11': PatternInfo(
+                name='Factory Patterns - Object Creation (Simple, Method, Abstract)',
+                description='Create objects without specifying their exact classes.',
+                demo=('factory_patterns', 'demo_factory_interview'),
+                interview_questions=(
                     'How to create objects without knowing their exact classes?',
                     'What\'s the difference between Simple Factory, Factory Method, and Abstract Factory?',
                     'How to add new product types without modifying existing code?',
                     'How to create families of related objects?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Payment processor factories',
                     'Document creator factories',
                     'UI theme factories',
                     'Database provider factories'
-                ]
-            },
-            '12': {
-                'name': 'Singleton Pattern - Single Instance Management',
-                'description': 'Ensure a class has only one instance with global access.',
-                'demo': demo_singleton_interview,
-                'interview_questions': [
+                )
+            ),
+            '12': PatternInfo(
+                name='Singleton Pattern - Single Instance Management',
+                description='Ensure a class has only one instance with global access.',
+                demo=('singleton_pattern', 'demo_singleton_interview'),
+                interview_questions=(
                     'How to ensure only one instance of a class exists?',
                     'What are the problems with Singleton pattern?',
                     'How to implement thread-safe Singleton?',
                     'When should you use Singleton vs Dependency Injection?'
-                ],
-                'real_world_examples': [
+                ),
+                real_world_examples=(
                     'Database connection managers',
                     'Logging systems',
                     'Configuration managers',
                     'UI managers (desktop apps)'
-                ]
-            }
+                )
+            )
         }
         
         self.help_info = {
@@ -280,30 +329,26 @@ class DesignPatternsMenu:
                 'What are the memory implications?'
             ]
         }
+        
+        self._demos: Dict[str, Callable[[], None]] = {}
+        self._menu_text = self._build_menu_text()
+        self._tips_text = self._build_tips_text()
+    
+    def _build_menu_text(self) -> str:
+        """Render the pattern menu once; it does not change between loops"""
+        parts = [f"\n📚 AVAILABLE PATTERNS:\n{_DASH50}\n"]
+        for key, pattern in self.patterns.items():
+            parts.append(f"{key}. {pattern.name}\n   {pattern.description}\n\n")
+        parts.append(_MENU_FOOTER)
+        return "".join(parts)
     
     def display_header(self):
         """Display the main header"""
-        print("\n" + "="*80)
-        print("🚀 DESIGN PATTERNS INTERVIEW PREP 🚀")
-        print("="*80)
-        print("Master the most common design patterns asked in technical interviews!")
-        print("Each pattern includes real-world examples, edge cases, and interview scenarios.")
-        print("="*80)
+        sys.stdout.write(_HEADER_TEXT)
     
     def display_menu(self):
         """Display the main menu"""
-        print("\n📚 AVAILABLE PATTERNS:")
-        print("-" * 50)
-        
-        for key, pattern in self.patterns.items():
-            print(f"{key}. {pattern['name']}")
-            print(f"   {pattern['description']}")
-            print()
-        
-        print("13. 📖 Interview Tips & Common Questions")
-        print("14. 🎯 Quick Pattern Comparison")
-        print("15. 🚪 Exit")
-        print("-" * 50)
+        sys.stdout.write(self._menu_text)
     
     def display_pattern_info(self, pattern_key: str):
         """Display detailed information about a pattern"""
@@ -313,71 +358,47 @@ class DesignPatternsMenu:
         
         pattern = self.patterns[pattern_key]
         
-        print("\n" + "="*60)
-        print(f"📖 {pattern['name']}")
-        print("="*60)
-        print(f"📝 Description: {pattern['description']}")
+        print("\n" + _EQ60)
+        print(f"📖 {pattern.name}")
+        print(_EQ60)
+        print(f"📝 Description: {pattern.description}")
         
         print(f"\n🎯 Common Interview Questions:")
-        for i, question in enumerate(pattern['interview_questions'], 1):
+        for i, question in enumerate(pattern.interview_questions, 1):
             print(f"   {i}. {question}")
         
         print(f"\n🌍 Real-World Examples:")
-        for i, example in enumerate(pattern['real_world_examples'], 1):
+        for i, example in enumerate(pattern.real_world_examples, 1):
             print(f"   {i}. {example}")
         
-        print("\n" + "="*60)
+        print("\n" + _EQ60)
+    
+    def _build_tips_text(self) -> str:
+        """Render the interview tips screen once from help_info"""
+        parts = [f"\n{_EQ60}\n📖 INTERVIEW TIPS & STRATEGIES\n{_EQ60}\n\n💡 Key Interview Tips:\n"]
+        parts.extend(f"   {tip}\n" for tip in self.help_info['interview_tips'])
+        parts.append("\n🔄 Common Follow-up Questions:\n")
+        parts.extend(f"   {i}. {question}\n"
+                     for i, question in enumerate(self.help_info['common_follow_ups'], 1))
+        parts.append(_TIPS_STRATEGY)
+        return "".join(parts)
     
     def display_interview_tips(self):
         """Display interview tips and common questions"""
-        print("\n" + "="*60)
-        print("📖 INTERVIEW TIPS & STRATEGIES")
-        print("="*60)
-        
-        print("\n💡 Key Interview Tips:")
-        for tip in self.help_info['interview_tips']:
-            print(f"   {tip}")
-        
-        print(f"\n🔄 Common Follow-up Questions:")
-        for i, question in enumerate(self.help_info['common_follow_ups'], 1):
-            print(f"   {i}. {question}")
-        
-        print(f"\n🎯 Pattern Selection Strategy:")
-        print("   1. Start with the problem you're trying to solve")
-        print("   2. Explain why this pattern is the best choice")
-        print("   3. Show a simple implementation")
-        print("   4. Discuss edge cases and error handling")
-        print("   5. Mention alternatives and trade-offs")
-        
-        print("\n" + "="*60)
+        sys.stdout.write(self._tips_text)
     
     def display_pattern_comparison(self):
         """Display a quick comparison of patterns"""
-        print("\n" + "="*80)
-        print("🎯 QUICK PATTERN COMPARISON")
-        print("="*80)
-        
-        comparison = {
-            'Observer': 'Event handling, notifications, MVC',
-            'Strategy': 'Algorithm selection, validation, payment processing',
-            'Adapter': 'Legacy integration, interface compatibility',
-            'Decorator': 'Adding features, middleware, cross-cutting concerns',
-            'Command': 'Undo/redo, queuing, macro operations'
-        }
-        
-        print("\n📊 When to Use Each Pattern:")
-        print("-" * 50)
-        for pattern, use_case in comparison.items():
-            print(f"🔹 {pattern:12} → {use_case}")
-        
-        print(f"\n🤔 Pattern Selection Guide:")
-        print("   • Need notifications? → Observer")
-        print("   • Multiple algorithms? → Strategy")
-        print("   • Incompatible interfaces? → Adapter")
-        print("   • Add features dynamically? → Decorator")
-        print("   • Need undo/redo? → Command")
-        
-        print("\n" + "="*80)
+        sys.stdout.write(_COMPARISON_TEXT)
+    
+    def _resolve_demo(self, pattern_key: str) -> Callable[[], None]:
+        """Import a pattern's demo function on first use and keep it"""
+        demo = self._demos.get(pattern_key)
+        if demo is None:
+            module_name, function_name = self.patterns[pattern_key].demo
+            demo = getattr(importlib.import_module(module_name), function_name)
+            self._demos[pattern_key] = demo
+        return demo
     
     def run_pattern_demo(self, pattern_key: str):
         """Run the demo for a selected pattern"""
@@ -387,19 +408,29 @@ class DesignPatternsMenu:
         
         pattern = self.patterns[pattern_key]
         
-        print(f"\n🚀 Running demo for: {pattern['name']}")
-        print("="*60)
+        print(f"\n🚀 Running demo for: {pattern.name}")
+        print(_EQ60)
+        
+        try:
+            demo = self._resolve_demo(pattern_key)
+        except (ImportError, AttributeError) as e:
+            print(f"❌ Error importing pattern modules: {e}")
+            print("Make sure all pattern files are in the same directory as main.py")
+            return
         
         try:
             # Run the demo
-            pattern['demo']()
+            demo()
             
-            print("\n" + "="*60)
+            print("\n" + _EQ60)
             print("✅ Demo completed successfully!")
             
+            if _NONINTERACTIVE:
+                return
+            
             # Ask if user wants to see pattern info
             response = input("\n📖 Would you like to see pattern details? (y/n): ").strip().lower()
-            if response in ['y', 'yes']:
+            if response in _YES:
                 self.display_pattern_info(pattern_key)
         
         except Exception as e:
@@ -429,15 +460,15 @@ class DesignPatternsMenu:
                     print("❌ Invalid choice! Please select 1-15.")
                 
                 # Ask if user wants to continue
-                if choice in self.patterns:
+                if choice in self.patterns and not _NONINTERACTIVE:
                     continue_choice = input("\n🔄 Would you like to explore another pattern? (y/n): ").strip().lower()
-                    if continue_choice not in ['y', 'yes']:
+                    if continue_choice not in _YES:
                         print("\n🎉 Thanks for using Design Patterns Interview Prep!")
                         print("Good luck with your interviews! 🚀")
                         break
                 
                 # Clear screen for better UX (optional)
-                if choice in ['13', '14']:
+                if choice in _INFO_CHOICES and not _NONINTERACTIVE:
                     input("\nPress Enter to continue...")
                 
             except KeyboardInterrupt:
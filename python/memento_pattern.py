@@ -18,10 +18,11 @@ so that the object can be restored to this state later without violating encapsu
 '''
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Deque
+from collections import deque
 from datetime import datetime
 import json
-import copy
+import time
 
 # ============================================================================
 # ORIGINATOR CLASSES (Objects whose state needs to be saved)
@@ -39,6 +40,7 @@ class GameCharacter:
         self.inventory = []
         self.skills = []
         self._state_version = 1
+        self._last_memento: Optional['CharacterMemento'] = None
     
     def level_up(self):
         """Level up the character"""
@@ -90,17 +92,37 @@ class GameCharacter:
     
     def create_memento(self) -> 'CharacterMemento':
         """Create a memento of current state"""
-        return CharacterMemento(
+        # Position, inventory and skills only hold ints and strings, so
+        # shallow copies are already independent snapshots; the lists are
+        # frozen as tuples since the memento never changes them
+        position = self.position.copy()
+        inventory = tuple(self.inventory)
+        skills = tuple(self.skills)
+        
+        # Fields unchanged since the previous memento share its objects, so
+        # a save history only pays for what actually changed
+        last = self._last_memento
+        if last is not None:
+            if position == last.position:
+                position = last.position
+            if inventory == last.inventory:
+                inventory = last.inventory
+            if skills == last.skills:
+                skills = last.skills
+        
+        memento = CharacterMemento(
             level=self.level,
             health=self.health,
             mana=self.mana,
             experience=self.experience,
-            position=copy.deepcopy(self.position),
-            inventory=copy.deepcopy(self.inventory),
-            skills=copy.deepcopy(self.skills),
+            position=position,
+            inventory=inventory,
+            skills=skills,
             version=self._state_version,
-            timestamp=datetime.now()
+            timestamp=time.time()
         )
+        self._last_memento = memento
+        return memento
     
     def restore_from_memento(self, memento: 'CharacterMemento'):
         """Restore state from memento"""
@@ -108,17 +130,24 @@ class GameCharacter:
         self.health = memento.health
         self.mana = memento.mana
         self.experience = memento.experience
-        self.position = copy.deepcopy(memento.position)
-        self.inventory = copy.deepcopy(memento.inventory)
-        self.skills = copy.deepcopy(memento.skills)
+        self.position = dict(memento.position)
+        self.inventory = list(memento.inventory)
+        self.skills = list(memento.skills)
         self._state_version = memento.version
-        print(f"🔄 {self.name} restored to version {memento.version} from {memento.timestamp}")
+        self._last_memento = memento
+        print(f"🔄 {self.name} restored to version {memento.version} from {datetime.fromtimestamp(memento.timestamp)}")
 
 class DocumentEditor:
     """Document editor that can save and restore states"""
+    # Mementos record only the edits since the previous one; every Nth is a
+    # full snapshot so restoring never replays a long chain
+    SNAPSHOT_INTERVAL = 8
+    
     def __init__(self, filename: str):
         self.filename = filename
-        self.content = ""
+        self._content = ""
+        self._last_memento: Optional['DocumentMemento'] = None
+        self._pending_edits: List[Tuple[int, int, str]] = []  # (position, removed, inserted)
         self.cursor_position = 0
         self.selection_start = 0
         self.selection_end = 0
@@ -128,11 +157,23 @@ class DocumentEditor:
         self.is_italic = False
         self._change_count = 0
     
+    @property
+    def content(self) -> str:
+        return self._content
+    
+    @content.setter
+    def content(self, value: str):
+        # Not an edit we can describe, so the next memento is a full snapshot
+        self._content = value
+        self._last_memento = None
+        self._pending_edits.clear()
+    
     def insert_text(self, text: str):
         """Insert text at cursor position"""
-        self.content = (self.content[:self.cursor_position] + 
-                       text + 
-                       self.content[self.cursor_position:])
+        self._content = (self._content[:self.cursor_position] + 
+                        text + 
+                        self._content[self.cursor_position:])
+        self._pending_edits.append((self.cursor_position, 0, text))
         self.cursor_position += len(text)
         self._change_count += 1
         print(f"📝 Inserted '{text}' at position {self.cursor_position - len(text)}")
@@ -140,10 +181,11 @@ class DocumentEditor:
     def delete_text(self, length: int):
         """Delete text before cursor"""
         if length > 0 and self.cursor_position >= length:
-            deleted = self.content[self.cursor_position - length:self.cursor_position]
-            self.content = (self.content[:self.cursor_position - length] + 
-                           self.content[self.cursor_position:])
+            deleted = self._content[self.cursor_position - length:self.cursor_position]
+            self._content = (self._content[:self.cursor_position - length] + 
+                            self._content[self.cursor_position:])
             self.cursor_position -= length
+            self._pending_edits.append((self.cursor_position, length, ""))
             self._change_count += 1
             print(f"🗑️ Deleted '{deleted}'")
     
@@ -171,8 +213,14 @@ class DocumentEditor:
     
     def create_memento(self) -> 'DocumentMemento':
         """Create a memento of current state"""
-        return DocumentMemento(
-            content=self.content,
+        base = self._last_memento
+        if base is not None and base.depth + 1 >= self.SNAPSHOT_INTERVAL:
+            base = None
+        memento = DocumentMemento(
+            content=self._content if base is None else None,
+            base=base,
+            edits=tuple(self._pending_edits) if base is not None else (),
+            content_length=len(self._content),
             cursor_position=self.cursor_position,
             selection_start=self.selection_start,
             selection_end=self.selection_end,
@@ -181,12 +229,17 @@ class DocumentEditor:
             is_bold=self.is_bold,
             is_italic=self.is_italic,
             change_count=self._change_count,
-            timestamp=datetime.now()
+            timestamp=time.time()
         )
+        self._last_memento = memento
+        self._pending_edits.clear()
+        return memento
     
     def restore_from_memento(self, memento: 'DocumentMemento'):
         """Restore state from memento"""
-        self.content = memento.content
+        self._content = memento.content
+        self._last_memento = memento
+        self._pending_edits.clear()
         self.cursor_position = memento.cursor_position
         self.selection_start = memento.selection_start
         self.selection_end = memento.selection_end
@@ -195,7 +248,7 @@ class DocumentEditor:
         self.is_bold = memento.is_bold
         self.is_italic = memento.is_italic
         self._change_count = memento.change_count
-        print(f"🔄 Document restored to change #{memento.change_count} from {memento.timestamp}")
+        print(f"🔄 Document restored to change #{memento.change_count} from {datetime.fromtimestamp(memento.timestamp)}")
 
 # ============================================================================
 # MEMENTO CLASSES (State snapshots)
@@ -203,9 +256,12 @@ class DocumentEditor:
 
 class CharacterMemento:
     """Memento for character state"""
+    __slots__ = ('level', 'health', 'mana', 'experience', 'position', 'inventory',
+                 'skills', 'version', 'timestamp')
+    
     def __init__(self, level: int, health: int, mana: int, experience: int,
-                 position: Dict[str, int], inventory: List[str], skills: List[str],
-                 version: int, timestamp: datetime):
+                 position: Dict[str, int], inventory: Tuple[str, ...], skills: Tuple[str, ...],
+                 version: int, timestamp: float):
         self.level = level
         self.health = health
         self.mana = mana
@@ -221,14 +277,26 @@ class CharacterMemento:
         return (f"Version {self.version} | Level {self.level} | "
                 f"Health {self.health} | Mana {self.mana} | "
                 f"Exp {self.experience} | Items {len(self.inventory)} | "
-                f"Skills {len(self.skills)} | {self.timestamp.strftime('%H:%M:%S')}")
+                f"Skills {len(self.skills)} | {time.strftime('%H:%M:%S', time.localtime(self.timestamp))}")
 
 class DocumentMemento:
-    """Memento for document state"""
-    def __init__(self, content: str, cursor_position: int, selection_start: int,
+    """Memento for document state (full snapshot, or edits on top of a base memento)"""
+    __slots__ = ('_content', '_base', '_edits', 'depth', 'content_length', 'cursor_position',
+                 'selection_start', 'selection_end', 'font_size', 'font_family',
+                 'is_bold', 'is_italic', 'change_count', 'timestamp')
+    
+    def __init__(self, content: Optional[str], cursor_position: int, selection_start: int,
                  selection_end: int, font_size: int, font_family: str,
-                 is_bold: bool, is_italic: bool, change_count: int, timestamp: datetime):
-        self.content = content
+                 is_bold: bool, is_italic: bool, change_count: int, timestamp: float,
+                 base: Optional['DocumentMemento'] = None,
+                 edits: Tuple[Tuple[int, int, str], ...] = (),
+                 content_length: Optional[int] = None):
+        # Exactly one of content (snapshot) or base + edits (delta) is given
+        self._content = content
+        self._base = base
+        self._edits = edits
+        self.depth = 0 if base is None else base.depth + 1
+        self.content_length = len(content) if content is not None else content_length
         self.cursor_position = cursor_position
         self.selection_start = selection_start
         self.selection_end = selection_end
@@ -239,11 +307,25 @@ class DocumentMemento:
         self.change_count = change_count
         self.timestamp = timestamp
     
+    @property
+    def content(self) -> str:
+        """Document text, replayed from the nearest snapshot"""
+        deltas = []
+        memento = self
+        while memento._content is None:
+            deltas.append(memento._edits)
+            memento = memento._base
+        content = memento._content
+        for edits in reversed(deltas):
+            for position, removed, inserted in edits:
+                content = content[:position] + inserted + content[position + removed:]
+        return content
+    
     def get_description(self) -> str:
         """Get memento description"""
-        return (f"Change #{self.change_count} | {len(self.content)} chars | "
+        return (f"Change #{self.change_count} | {self.content_length} chars | "
                 f"Cursor {self.cursor_position} | {self.font_family} {self.font_size}pt | "
-                f"{self.timestamp.strftime('%H:%M:%S')}")
+                f"{time.strftime('%H:%M:%S', time.localtime(self.timestamp))}")
 
 # ============================================================================
 # CARETAKER CLASSES (Manage mementos)
@@ -252,19 +334,16 @@ class DocumentMemento:
 class GameSaveManager:
     """Manages game saves and checkpoints"""
     def __init__(self, max_saves: int = 10):
-        self.saves: List[CharacterMemento] = []
-        self.checkpoints: List[CharacterMemento] = []
+        # Bounded deques drop the oldest entry in O(1) once full
+        self.saves: Deque[CharacterMemento] = deque(maxlen=max_saves)
+        self.checkpoints: Deque[CharacterMemento] = deque(maxlen=max_saves)
         self.max_saves = max_saves
         self.current_save_index = -1
     
     def save_game(self, character: GameCharacter) -> bool:
         """Save current game state"""
         memento = character.create_memento()
-        self.saves.append(memento)
-        
-        # Limit number of saves
-        if len(self.saves) > self.max_saves:
-            self.saves.pop(0)
+        self.saves.append(memento)  # evicts the oldest save when full
         
         self.current_save_index = len(self.saves) - 1
         print(f"💾 Game saved: {memento.get_description()}")
@@ -319,7 +398,8 @@ class GameSaveManager:
     def delete_save(self, save_index: int) -> bool:
         """Delete a save"""
         if 0 <= save_index < len(self.saves):
-            deleted_save = self.saves.pop(save_index)
+            deleted_save = self.saves[save_index]
+            del self.saves[save_index]
             print(f"🗑️ Deleted save: {deleted_save.get_description()}")
             
             # Adjust current save index
@@ -334,7 +414,7 @@ class GameSaveManager:
 class DocumentHistoryManager:
     """Manages document history and undo/redo"""
     def __init__(self, max_history: int = 50):
-        self.history: List[DocumentMemento] = []
+        self.history: Deque[DocumentMemento] = deque(maxlen=max_history)
         self.current_index = -1
         self.max_history = max_history
     
@@ -343,17 +423,13 @@ class DocumentHistoryManager:
         memento = document.create_memento()
         
         # Remove any history after current index (for redo)
-        if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
+        while len(self.history) > self.current_index + 1:
+            self.history.pop()
         
+        # Limit history size: a full deque drops its oldest entry
         self.history.append(memento)
         self.current_index = len(self.history) - 1
         
-        # Limit history size
-        if len(self.history) > self.max_history:
-            self.history.pop(0)
-            self.current_index -= 1
-        
         print(f"📝 State saved: {memento.get_description()}")
         return True
     
@@ -19,7 +19,7 @@ so that when one object changes state, all its dependents are notified and updat
 '''
 
 from abc import ABC, abstractmethod
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Tuple
 import time
 
 class Observer(ABC):
@@ -37,7 +37,9 @@ class Observable:
     - Context passing
     """
     def __init__(self):
-        self._observers: List[Observer] = []
+        # Copy-on-write: attach/detach swap in a new tuple, so notification can
+        # iterate the current one directly, even if an observer detaches itself
+        self._observers: Tuple[Observer, ...] = ()
         self._state = None
         self._name = self.__class__.__name__
 
@@ -47,7 +49,7 @@ class Observable:
         Returns True if added, False if already exists
         """
         if observer not in self._observers:
-            self._observers.append(observer)
+            self._observers += (observer,)
             print(f"[{self._name}] Observer {observer.__class__.__name__} added")
             return True
         print(f"[{self._name}] Observer {observer.__class__.__name__} already exists")
@@ -59,7 +61,8 @@ class Observable:
         Returns True if removed, False if not found
         """
         if observer in self._observers:
-            self._observers.remove(observer)
+            index = self._observers.index(observer)
+            self._observers = self._observers[:index] + self._observers[index + 1:]
             print(f"[{self._name}] Observer {observer.__class__.__name__} removed")
             return True
         print(f"[{self._name}] Observer {observer.__class__.__name__} not found")
@@ -68,7 +71,7 @@ class Observable:
     def notify_observers(self, *args, **kwargs):
         """
         Notify all observers with error handling
-        Uses copy of observers list to allow removal during iteration
+        Iterates the immutable observer tuple, so removal during iteration is safe
         """
         if not self._observers:
             print(f"[{self._name}] No observers to notify")
@@ -76,17 +79,19 @@ class Observable:
 
         print(f"[{self._name}] Notifying {len(self._observers)} observers...")
         
-        # Create copy to allow removal during iteration
-        observers_copy = self._observers[:]
-        
-        for observer in observers_copy:
+        failed = None
+        for observer in self._observers:
             try:
                 observer.update(self, *args, **kwargs)
             except Exception as e:
                 print(f"[{self._name}] ❌ Observer {observer.__class__.__name__} failed: {e}")
-                # Remove failing observer to prevent future failures
-                if observer in self._observers:
-                    self._observers.remove(observer)
+                if failed is None:
+                    failed = []
+                failed.append(observer)
+        
+        # Remove failing observers to prevent future failures
+        if failed:
+            self._observers = tuple(o for o in self._observers if o not in failed)
 
     @property
     def state(self):